@@ -34,6 +34,17 @@ constexpr size_t MAX_REQUEST_SIZE = 16384;  // 16KB max request
 constexpr size_t MAX_RESPONSE_SIZE = 4096;
 constexpr int KEEPALIVE_TIMEOUT_POLLS = 10;  // ~5 seconds at 2 polls/sec
 
+// Raw TCP frame stream: same packets as USB serial, minus the HTTP envelope
+// Full: 0xFE + u16 length + RGB, Delta: 0xFD + u16 count + (u16 idx, u8 r, u8 g, u8 b) * count
+// Each packet is answered with one status byte
+constexpr uint16_t RAW_PORT = 5001;
+constexpr uint8_t RAW_CMD_FRAME = 0xFE;
+constexpr uint8_t RAW_CMD_DELTA = 0xFD;
+constexpr uint8_t RAW_RESP_OK = 0x01;
+constexpr uint8_t RAW_RESP_BUSY = 0x02;
+constexpr uint8_t RAW_RESP_ERROR = 0x03;
+constexpr size_t RAW_MAX_PACKET = 3 + 1024 * 5;  // Largest delta
+
 struct ClientState {
     struct tcp_pcb* pcb;
     uint8_t* request_buffer;
@@ -44,7 +55,14 @@ struct ClientState {
     int idle_polls;
 };
 
+struct RawClientState {
+    struct tcp_pcb* pcb;
+    size_t len;
+    uint8_t buffer[RAW_MAX_PACKET];
+};
+
 struct tcp_pcb* server_pcb = nullptr;
+struct tcp_pcb* raw_server_pcb = nullptr;
 struct udp_pcb* udp_server_pcb = nullptr;
 struct udp_pcb* ntr_server_pcb = nullptr;  // NTR streaming on port 8001
 volatile int active_connections = 0;
@@ -232,6 +250,46 @@ static void reset_client_state(ClientState* state) {
     state->idle_polls = 0;
 }
 
+// Queue a full RGB frame for Core 0 (caller checks g_pending_frame)
+static void queue_full_frame(const uint8_t* rgb) {
+    constexpr size_t size = sizeof(g_frame_buffer);
+
+    // Copy to staging buffer first (outside lock)
+    memcpy(g_frame_buffer, rgb, size);
+
+    // Then atomically swap to ready buffer under lock
+    uint32_t irq = spin_lock_blocking(g_frame_lock);
+    memcpy(g_ready_frame, g_frame_buffer, size);
+    g_delta_count = 0;  // Full frame, not delta
+    g_frame_sequence++;
+    g_pending_frame = true;
+    spin_unlock(g_frame_lock, irq);
+}
+
+// Apply delta entries (u16 index, u8 r, u8 g, u8 b) to the ready frame
+static void queue_delta(const uint8_t* entry, uint16_t count) {
+    uint32_t irq = spin_lock_blocking(g_frame_lock);
+
+    // Apply delta updates to the ready frame and record indices
+    uint16_t valid_count = 0;
+    for (uint16_t i = 0; i < count; i++) {
+        uint16_t idx = entry[0] | (entry[1] << 8);
+        if (idx < 1024) {
+            size_t offset = idx * 3;
+            g_ready_frame[offset]     = entry[2];  // R
+            g_ready_frame[offset + 1] = entry[3];  // G
+            g_ready_frame[offset + 2] = entry[4];  // B
+            g_delta_indices[valid_count++] = idx;
+        }
+        entry += 5;
+    }
+    g_delta_count = valid_count;
+    g_frame_sequence++;
+    g_pending_frame = true;
+
+    spin_unlock(g_frame_lock, irq);
+}
+
 // Forward declaration
 static err_t tcp_recv_callback(void* arg, struct tcp_pcb* pcb, struct pbuf* p, err_t err);
 
@@ -342,16 +400,7 @@ static void process_request(ClientState* state) {
             int height = pimoroni::CosmicUnicorn::HEIGHT;
             size_t expected = width * height * 3;
             if (body_len >= expected && expected <= sizeof(g_frame_buffer)) {
-                // Copy to staging buffer first (outside lock)
-                memcpy(g_frame_buffer, body, expected);
-
-                // Then atomically swap to ready buffer under lock
-                uint32_t irq = spin_lock_blocking(g_frame_lock);
-                memcpy(g_ready_frame, g_frame_buffer, expected);
-                g_delta_count = 0;  // Full frame, not delta
-                g_frame_sequence++;
-                g_pending_frame = true;
-                spin_unlock(g_frame_lock, irq);
+                queue_full_frame((const uint8_t*)body);
             }
             json_response = "{\"status\":\"ok\"}";
         } else {
@@ -370,27 +419,7 @@ static void process_request(ClientState* state) {
             size_t expected = 2 + count * 5;
 
             if (body_len >= expected && count <= 1024) {
-                uint32_t irq = spin_lock_blocking(g_frame_lock);
-
-                // Apply delta updates to the ready frame and record indices
-                const uint8_t* entry = p + 2;
-                uint16_t valid_count = 0;
-                for (uint16_t i = 0; i < count; i++) {
-                    uint16_t idx = entry[0] | (entry[1] << 8);
-                    if (idx < 1024) {
-                        size_t offset = idx * 3;
-                        g_ready_frame[offset]     = entry[2];  // R
-                        g_ready_frame[offset + 1] = entry[3];  // G
-                        g_ready_frame[offset + 2] = entry[4];  // B
-                        g_delta_indices[valid_count++] = idx;
-                    }
-                    entry += 5;
-                }
-                g_delta_count = valid_count;
-                g_frame_sequence++;
-                g_pending_frame = true;
-
-                spin_unlock(g_frame_lock, irq);
+                queue_delta(p + 2, count);
                 json_response = "{\"status\":\"ok\"}";
             } else {
                 json_response = "{\"status\":\"error\",\"message\":\"invalid delta\"}";
@@ -738,6 +767,134 @@ static void udp_recv_callback(void* arg, struct udp_pcb* pcb, struct pbuf* p,
     pbuf_free(p);
 }
 
+static void raw_close(RawClientState* state) {
+    if (state) {
+        if (state->pcb) {
+            tcp_arg(state->pcb, nullptr);
+            tcp_recv(state->pcb, nullptr);
+            tcp_err(state->pcb, nullptr);
+            tcp_close(state->pcb);
+        }
+        free(state);
+        if (active_connections > 0) {
+            active_connections--;
+        }
+    }
+}
+
+// Handle one complete raw packet, returning the status byte to send back
+static uint8_t raw_process_packet(const uint8_t* packet, uint16_t n) {
+    if (g_pending_frame) {
+        // Previous frame not yet drawn - reject to avoid dropping frames
+        return RAW_RESP_BUSY;
+    }
+    if (packet[0] == RAW_CMD_FRAME) {
+        if (n != sizeof(g_frame_buffer)) return RAW_RESP_ERROR;
+        queue_full_frame(packet + 3);
+    } else {
+        queue_delta(packet + 3, n);
+    }
+    return RAW_RESP_OK;
+}
+
+// Raw stream receive callback - packets may span or share pbufs
+static err_t raw_recv_callback(void* arg, struct tcp_pcb* pcb, struct pbuf* p, err_t err) {
+    RawClientState* state = (RawClientState*)arg;
+
+    if (!p) {
+        raw_close(state);
+        return ERR_OK;
+    }
+
+    if (err != ERR_OK) {
+        pbuf_free(p);
+        raw_close(state);
+        return err;
+    }
+
+    uint16_t consumed = 0;
+    bool replied = false;
+    while (consumed < p->tot_len) {
+        // Append as much as fits, then handle every complete packet buffered
+        size_t chunk = p->tot_len - consumed;
+        if (chunk > sizeof(state->buffer) - state->len) {
+            chunk = sizeof(state->buffer) - state->len;
+        }
+        pbuf_copy_partial(p, state->buffer + state->len, chunk, consumed);
+        state->len += chunk;
+        consumed += chunk;
+
+        size_t offset = 0;
+        while (state->len - offset >= 3) {
+            const uint8_t* packet = state->buffer + offset;
+            uint16_t n = packet[1] | (packet[2] << 8);
+            size_t expected;
+            if (packet[0] == RAW_CMD_FRAME) {
+                expected = 3 + n;
+            } else if (packet[0] == RAW_CMD_DELTA && n <= 1024) {
+                expected = 3 + n * 5;
+            } else {
+                expected = 0;
+            }
+            if (expected == 0 || expected > sizeof(state->buffer)) {
+                // Lost framing - drop the connection, the sender reconnects
+                uint8_t resp = RAW_RESP_ERROR;
+                tcp_write(pcb, &resp, 1, TCP_WRITE_FLAG_COPY);
+                tcp_output(pcb);
+                pbuf_free(p);
+                raw_close(state);
+                return ERR_OK;
+            }
+            if (state->len - offset < expected) break;
+
+            uint8_t resp = raw_process_packet(packet, n);
+            tcp_write(pcb, &resp, 1, TCP_WRITE_FLAG_COPY);
+            replied = true;
+            offset += expected;
+        }
+        if (offset > 0) {
+            memmove(state->buffer, state->buffer + offset, state->len - offset);
+            state->len -= offset;
+        }
+    }
+
+    tcp_recved(pcb, p->tot_len);
+    pbuf_free(p);
+    if (replied) {
+        tcp_output(pcb);
+    }
+    return ERR_OK;
+}
+
+static void raw_err_callback(void* arg, err_t err) {
+    RawClientState* state = (RawClientState*)arg;
+    if (state) {
+        state->pcb = nullptr;
+        raw_close(state);
+    }
+}
+
+static err_t raw_accept_callback(void* arg, struct tcp_pcb* newpcb, err_t err) {
+    if (err != ERR_OK || !newpcb) {
+        return ERR_VAL;
+    }
+
+    RawClientState* state = (RawClientState*)calloc(1, sizeof(RawClientState));
+    if (!state) {
+        tcp_abort(newpcb);
+        return ERR_MEM;
+    }
+
+    state->pcb = newpcb;
+    tcp_nagle_disable(newpcb);
+    tcp_arg(newpcb, state);
+    tcp_recv(newpcb, raw_recv_callback);
+    tcp_err(newpcb, raw_err_callback);
+    active_connections++;
+
+    return ERR_OK;
+}
+
 // TCP accept callback
 static err_t tcp_accept_callback(void* arg, struct tcp_pcb* newpcb, err_t err) {
     if (err != ERR_OK || !newpcb) {
@@ -802,6 +959,19 @@ bool init(uint16_t port) {
 
     tcp_accept(server_pcb, tcp_accept_callback);
 
+    // Raw TCP frame stream - HTTP stays available as a fallback
+    struct tcp_pcb* raw_pcb = tcp_new_ip_type(IPADDR_TYPE_ANY);
+    if (raw_pcb && tcp_bind(raw_pcb, IP_ADDR_ANY, RAW_PORT) == ERR_OK) {
+        raw_server_pcb = tcp_listen_with_backlog(raw_pcb, 1);
+    }
+    if (raw_server_pcb) {
+        tcp_accept(raw_server_pcb, raw_accept_callback);
+        printf("Raw frame stream started on port %d\n", RAW_PORT);
+    } else {
+        printf("Failed to start raw frame stream\n");
+        if (raw_pcb) tcp_close(raw_pcb);
+    }
+
     // Also set up UDP server on same port for low-latency streaming (32x32 raw frames)
     udp_server_pcb = udp_new();
     if (udp_server_pcb) {
@@ -846,6 +1016,10 @@ void stop() {
         tcp_close(server_pcb);
         server_pcb = nullptr;
     }
+    if (raw_server_pcb) {
+        tcp_close(raw_server_pcb);
+        raw_server_pcb = nullptr;
+    }
     if (udp_server_pcb) {
         udp_remove(udp_server_pcb);
         udp_server_pcb = nullptr;
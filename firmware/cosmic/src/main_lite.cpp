@@ -25,13 +25,18 @@ CosmicUnicorn cosmic_unicorn;
 constexpr uint8_t SERIAL_CMD_FRAME = 0xFE;       // Full frame: 0xFE + 3072 bytes RGB
 constexpr uint8_t SERIAL_CMD_DELTA = 0xFD;       // Delta: 0xFD + u16 count + (u16 idx, u8 r, u8 g, u8 b) * count
 constexpr uint8_t SERIAL_CMD_BRIGHTNESS = 0xFC; // Brightness: 0xFC + u8 (0-255 mapped to 0.0-1.0)
+constexpr uint8_t SERIAL_CMD_FRAME565 = 0xFB;    // Full frame: 0xFB + 2048 bytes RGB565 (LE)
+constexpr uint8_t SERIAL_CMD_DELTA565 = 0xFA;    // Delta: 0xFA + u16 count + (u16 idx, u16 rgb565) * count
 constexpr uint8_t SERIAL_RESP_OK = 0x01;
 constexpr uint8_t SERIAL_RESP_BUSY = 0x02;
 constexpr uint8_t SERIAL_RESP_ERROR = 0x03;
 constexpr size_t FRAME_SIZE = 32 * 32 * 3;  // 3072 bytes
+constexpr size_t FRAME_SIZE_565 = 32 * 32 * 2;  // 2048 bytes
 
 // Serial frame buffer (separate from HTTP to avoid conflicts)
 static uint8_t g_serial_frame[FRAME_SIZE];
+// Receive buffer for RGB565 frames, expanded into g_serial_frame
+static uint8_t g_serial_frame565[FRAME_SIZE_565];
 static volatile bool g_serial_frame_pending = false;
 
 static volatile bool wifi_running = true;
@@ -96,6 +101,16 @@ static bool serial_read_exact(uint8_t* buf, size_t len, uint32_t timeout_ms) {
     return true;
 }
 
+// Expand an RGB565 pixel to RGB888, replicating high bits into the low bits
+static inline void rgb565_to_rgb888(uint16_t c, uint8_t* out) {
+    uint8_t r = (c >> 11) & 0x1F;
+    uint8_t g = (c >> 5) & 0x3F;
+    uint8_t b = c & 0x1F;
+    out[0] = (r << 3) | (r >> 2);
+    out[1] = (g << 2) | (g >> 4);
+    out[2] = (b << 3) | (b >> 2);
+}
+
 // Process incoming serial commands - returns true if a frame was received
 static bool process_serial_input(CosmicUnicorn& display, float& brightness) {
     if (!tud_cdc_connected() || !tud_cdc_available()) {
@@ -173,6 +188,72 @@ static bool process_serial_input(CosmicUnicorn& display, float& brightness) {
         tud_cdc_write_flush();
         return true;
     }
+    else if (cmd == SERIAL_CMD_FRAME565) {
+        // Full RGB565 frame: read 2048 bytes, expand to RGB888
+        if (g_serial_frame_pending) {
+            tud_cdc_write_char(SERIAL_RESP_BUSY);
+            tud_cdc_write_flush();
+            // Drain incoming data to stay in sync
+            serial_read_exact(g_serial_frame565, FRAME_SIZE_565, 100);
+            return false;
+        }
+
+        if (!serial_read_exact(g_serial_frame565, FRAME_SIZE_565, 100)) {
+            tud_cdc_write_char(SERIAL_RESP_ERROR);
+            tud_cdc_write_flush();
+            return false;
+        }
+
+        for (size_t i = 0; i < 1024; i++) {
+            uint16_t c = g_serial_frame565[i * 2] | (g_serial_frame565[i * 2 + 1] << 8);
+            rgb565_to_rgb888(c, &g_serial_frame[i * 3]);
+        }
+
+        g_serial_frame_pending = true;
+        tud_cdc_write_char(SERIAL_RESP_OK);
+        tud_cdc_write_flush();
+        return true;
+    }
+    else if (cmd == SERIAL_CMD_DELTA565) {
+        // RGB565 delta: u16 count + 4-byte entries
+        if (g_serial_frame_pending) {
+            tud_cdc_write_char(SERIAL_RESP_BUSY);
+            tud_cdc_write_flush();
+            return false;
+        }
+
+        uint8_t count_buf[2];
+        if (!serial_read_exact(count_buf, 2, 50)) {
+            tud_cdc_write_char(SERIAL_RESP_ERROR);
+            tud_cdc_write_flush();
+            return false;
+        }
+        uint16_t count = count_buf[0] | (count_buf[1] << 8);
+
+        if (count > 1024) {
+            tud_cdc_write_char(SERIAL_RESP_ERROR);
+            tud_cdc_write_flush();
+            return false;
+        }
+
+        for (uint16_t i = 0; i < count; i++) {
+            uint8_t entry[4];  // u16 index + u16 RGB565
+            if (!serial_read_exact(entry, 4, 50)) {
+                tud_cdc_write_char(SERIAL_RESP_ERROR);
+                tud_cdc_write_flush();
+                return false;
+            }
+            uint16_t idx = entry[0] | (entry[1] << 8);
+            if (idx < 1024) {
+                rgb565_to_rgb888(entry[2] | (entry[3] << 8), &g_serial_frame[idx * 3]);
+            }
+        }
+
+        g_serial_frame_pending = true;
+        tud_cdc_write_char(SERIAL_RESP_OK);
+        tud_cdc_write_flush();
+        return true;
+    }
     else if (cmd == SERIAL_CMD_BRIGHTNESS) {
         uint8_t val;
         if (!serial_read_exact(&val, 1, 50)) {
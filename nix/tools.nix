@@ -13,6 +13,7 @@ let
     pygobject3
     dbus-python
     pygame  # for cosmic_mock.py
+    numpy   # vectorized frame diffing in cosmic_cast.py
   ]);
 
   # Runtime libraries for ntrviewer-hr (dlopen'd by static SDL3)
@@ -0,0 +1,45 @@
+"""Pytest setup for the tools scripts.
+
+cosmic_cast imports GStreamer, D-Bus and pyserial at module level but the
+tests only exercise its pure-Python parts, so stand in empty modules for
+whichever of those aren't installed. Nothing is stubbed when they are.
+"""
+
+import importlib.util
+import sys
+import types
+
+# perf_test.py matches pytest's *_test.py pattern, but it is a benchmark
+# against a live device: its test_* functions take a connection, not fixtures
+collect_ignore = ["perf_test.py"]
+
+
+def _placeholder(*args, **kwargs):
+    raise RuntimeError("not available in tests")
+
+
+# Top-level package -> {module: attributes} to provide when it's missing
+STUBS = {
+    "gi": {
+        "gi": {"require_version": lambda namespace, version: None},
+        "gi.repository": {"GLib": types.ModuleType("GLib"),
+                          "Gst": types.ModuleType("Gst"),
+                          "GstApp": types.ModuleType("GstApp")},
+    },
+    "dbus": {
+        "dbus": {},
+        "dbus.mainloop": {},
+        "dbus.mainloop.glib": {"DBusGMainLoop": _placeholder},
+    },
+    "serial": {
+        "serial": {"Serial": _placeholder},
+    },
+}
+
+for package, modules in STUBS.items():
+    if importlib.util.find_spec(package) is not None:
+        continue
+    for name, attrs in modules.items():
+        module = types.ModuleType(name)
+        module.__dict__.update(attrs)
+        sys.modules[name] = module
@@ -10,7 +10,7 @@ On first run, GNOME will ask you to pick a window/monitor to share.
 After that, frames stream continuously with no further interaction.
 
 Usage:
-  python3.13 pcsx2_to_unicorn.py [--host cosmic.lan] [--fps N] [--wifi]
+  python3.13 pcsx2_to_unicorn.py [--host cosmic.lan] [--fps N] [--wifi] [--http] [--format rgb565]
 
 Automatically uses USB serial (~100 FPS) if the Pico is connected,
 otherwise WiFi (~30 FPS). Use --wifi to force WiFi mode.
@@ -20,19 +20,20 @@ import argparse
 import glob
 import http.client
 import os
-import queue
+import selectors
 import shutil
 import signal
 import socket
 import struct
 import sys
-import zlib
 import termios
 import threading
 import time
 import tty
 import urllib.request
+from collections import deque
 
+import numpy as np
 import serial
 
 import dbus
@@ -46,7 +47,54 @@ from gi.repository import GLib, Gst, GstApp
 WIDTH = 32
 HEIGHT = 32
 FRAME_SIZE = WIDTH * HEIGHT * 3  # 3072 bytes RGB
-PIXEL_RANGE = range(0, FRAME_SIZE, 3)  # Pre-computed for hot path
+FRAME_SIZE_565 = WIDTH * HEIGHT * 2  # 2048 bytes RGB565 (serial only)
+
+# Delta entry on the wire: u16 pixel index + RGB, packed (same as '<HBBB')
+DELTA_ENTRY = np.dtype([("index", "<u2"), ("rgb", "u1", 3)])
+# RGB565 delta entry: u16 pixel index + little-endian u16 colour (same as '<HH')
+DELTA_ENTRY_565 = np.dtype([("index", "<u2"), ("rgb", "<u2")])
+# Delta header: u16 entry count, compiled once rather than per packet
+DELTA_COUNT = struct.Struct('<H')
+
+
+NO_PIXELS = np.empty(0, dtype=np.intp)
+
+
+def changed_pixels(cur, prev, neq, mask, limit):
+    """Return indices of pixels that differ between two frames.
+
+    Frames are either (1024, 3) uint8 or (1024,) uint16 words for RGB565.
+    Returns None as soon as more than `limit` pixels changed, before building
+    the index array, and an empty array for identical frames, so no separate
+    fingerprint pass is needed. neq (1024, 3) and mask (1024,) are
+    caller-owned bool scratch arrays, so the compare and reduce run without
+    allocating temporaries each frame.
+    """
+    # Coarse pass on 8-byte words first. A changed pixel touches at most two
+    # words and a word spans at most four pixels, which bounds the pixel
+    # count: over 2 * limit words is certainly too many, and at most
+    # limit / 4 words is certainly few enough to skip the exact count
+    cur_words = cur.reshape(-1).view(np.uint64)
+    words_neq = mask[:cur_words.size]
+    np.not_equal(cur_words, prev.reshape(-1).view(np.uint64), out=words_neq)
+    changed_words = np.count_nonzero(words_neq)
+    if changed_words == 0:
+        return NO_PIXELS  # Identical frame
+    if changed_words > 2 * limit:
+        return None
+
+    if cur.ndim == 1:
+        # Whole pixel in one word - a single compare, no planes to merge
+        np.not_equal(cur, prev, out=mask)
+    else:
+        np.not_equal(cur, prev, out=neq)
+        # OR the byte planes of the mask rather than any(axis=1): NumPy reduces
+        # poorly over a 3 wide inner axis, while strided ORs stay vectorized
+        np.logical_or(neq[:, 0], neq[:, 1], out=mask)
+        np.logical_or(mask, neq[:, 2], out=mask)
+    if 4 * changed_words > limit and np.count_nonzero(mask) > limit:
+        return None
+    return np.flatnonzero(mask)
 
 PORTAL_BUS = "org.freedesktop.portal.Desktop"
 
@@ -55,12 +103,11 @@ class InstantFPS:
     """Rolling window FPS tracker for instantaneous performance measurement."""
 
     def __init__(self, window_size=30):
-        from collections import deque
         self.times = deque(maxlen=window_size)
 
-    def tick(self):
-        """Record a frame timestamp."""
-        self.times.append(time.monotonic())
+    def tick(self, now=None):
+        """Record a frame timestamp (pass one in if the caller already has it)."""
+        self.times.append(time.monotonic() if now is None else now)
 
     @property
     def fps(self):
@@ -75,12 +122,83 @@ class InstantFPS:
         self.times.clear()
 
 
+class FrameMailbox:
+    """Single-slot, newest-wins frame handoff from the capture thread to the sender.
+
+    Frames live in pooled bytearrays instead of a fresh bytes() each. One
+    producer and one consumer: deque.append and deque.pop are each atomic
+    under the GIL, so no lock is needed. A frame replaced before the sender
+    took it goes straight back to the pool, so the pool holds steady under
+    backpressure instead of draining into per-frame allocations.
+    """
+
+    # Buffers in use at once under backpressure: one being filled, one in the
+    # slot, one being sent and the sender's previous frame
+    POOL_SIZE = 4
+
+    def __init__(self, frame_size, pool_size=POOL_SIZE):
+        self.frame_size = frame_size
+        self.free = deque(bytearray(frame_size) for _ in range(pool_size))
+        self._slot = deque(maxlen=1)
+
+    def get_buffer(self):
+        """Buffer for the next frame (producer side)."""
+        try:
+            return self.free.popleft()
+        except IndexError:
+            return bytearray(self.frame_size)  # Pool exhausted - should be rare
+
+    def put(self, data):
+        """Publish a frame, recycling one the sender never took (producer side)."""
+        try:
+            self.free.append(self._slot.pop())
+        except IndexError:
+            pass  # Slot empty - the sender took the previous frame
+        self._slot.append(data)
+
+    def take(self):
+        """Newest published frame, or None if there is none (consumer side)."""
+        try:
+            return self._slot.pop()
+        except IndexError:
+            return None
+
+    def recycle(self, buf):
+        """Return a buffer the sender no longer references (consumer side)."""
+        self.free.append(buf)
+
+
+class CropState:
+    """Cached videocrop sides, so reads don't go through GObject properties.
+
+    All crop writes go through set(), which keeps the cache and the element
+    in step.
+    """
+
+    def __init__(self, elem):
+        self.elem = elem
+        self.left = elem.get_property("left")
+        self.right = elem.get_property("right")
+        self.top = elem.get_property("top")
+        self.bottom = elem.get_property("bottom")
+
+    def set(self, side, value):
+        """Set one crop side on the element and in the cache."""
+        if getattr(self, side) == value:
+            return  # Skip the GObject setter (and pipeline renegotiation)
+        setattr(self, side, value)
+        self.elem.set_property(side, value)
+
+
 class StatusUI:
     """Terminal UI with 2D minimap, status line, and log area."""
 
     MAP_W = 32  # Width of minimap in chars
     MAP_H = 10  # Height of minimap
     LOG_LINES = 6  # Number of log lines to show
+    RENDER_INTERVAL = 0.1  # update() redraws at most 10x/sec
+    GREEN_CELL = "\033[42m \033[0m"  # Green bg for viewport
+    GRAY_CELL = "\033[100m \033[0m"  # Gray bg for outside
 
     def __init__(self):
         self.frames_sent = 0
@@ -98,18 +216,25 @@ class StatusUI:
         self._term_size = (80, 24)
         self._needs_clear = True
         self._log = []  # Log messages
+        self._map_key = None  # Viewport (x1, x2, y1, y2) of cached minimap
+        self._map_lines = []
+        self._last_render = 0.0
+        self._dirty = False  # Throttled update waiting for flush()
+        # log() also arrives from the GLib and GStreamer threads
+        self._lock = threading.RLock()
 
     def log(self, msg):
         """Add a message to the log and update display."""
         # Strip leading whitespace for cleaner display
         msg = msg.lstrip()
-        self._log.append(msg)
-        # Keep only recent messages
-        if len(self._log) > 50:
-            self._log = self._log[-50:]
-        # Update display if started
-        if self._started:
-            self._render()
+        with self._lock:
+            self._log.append(msg)
+            # Keep only recent messages
+            if len(self._log) > 50:
+                self._log = self._log[-50:]
+            # Update display if started
+            if self._started:
+                self._render()
 
     def start(self):
         """Initialize display area."""
@@ -133,16 +258,45 @@ class StatusUI:
         self._term_size = (size.columns, size.lines)
 
     def update(self, **kwargs):
-        """Update status fields and redraw."""
-        for k, v in kwargs.items():
-            if hasattr(self, k):
-                setattr(self, k, v)
-        self._render()
+        """Update status fields and redraw, at most every RENDER_INTERVAL.
+
+        Updates inside the interval only mark the display dirty; the main
+        loop calls flush() so the last one still shows once updates stop.
+        """
+        with self._lock:
+            for k, v in kwargs.items():
+                if hasattr(self, k):
+                    setattr(self, k, v)
+            if time.monotonic() - self._last_render >= self.RENDER_INTERVAL:
+                self._render()
+            else:
+                self._dirty = True
+
+    def flush(self):
+        """Draw a throttled update once it is due.
+
+        Returns the seconds until it will be due (a select() timeout), or
+        None when nothing is pending.
+        """
+        with self._lock:
+            if not self._dirty:
+                return None
+            wait = self._last_render + self.RENDER_INTERVAL - time.monotonic()
+            if wait > 0:
+                return wait
+            self._render()
+            return None
 
     def _render(self):
         """Render minimap and status centered in terminal."""
+        with self._lock:
+            self._draw()
+
+    def _draw(self):
         if not self._started:
             return
+        self._last_render = time.monotonic()
+        self._dirty = False
 
         term_w, term_h = self._term_size
 
@@ -174,19 +328,18 @@ class StatusUI:
         y1 = max(0, min(y1, self.MAP_H - 1))
         y2 = max(y1 + 1, min(y2, self.MAP_H))
 
-        # Build minimap lines
-        map_lines = []
-        map_lines.append("┌" + "─" * self.MAP_W + "┐")
-        for row in range(self.MAP_H):
-            line = "│"
-            for col in range(self.MAP_W):
-                if y1 <= row < y2 and x1 <= col < x2:
-                    line += "\033[42m \033[0m"  # Green bg for viewport
-                else:
-                    line += "\033[100m \033[0m"  # Gray bg for outside
-            line += "│"
-            map_lines.append(line)
-        map_lines.append("└" + "─" * self.MAP_W + "┘")
+        # Build minimap lines - only when the viewport moved
+        if self._map_key != (x1, x2, y1, y2):
+            gray_row = "│" + self.GRAY_CELL * self.MAP_W + "│"
+            view_row = ("│" + self.GRAY_CELL * x1 + self.GREEN_CELL * (x2 - x1)
+                        + self.GRAY_CELL * (self.MAP_W - x2) + "│")
+            map_lines = ["┌" + "─" * self.MAP_W + "┐"]
+            map_lines += [view_row if y1 <= row < y2 else gray_row
+                          for row in range(self.MAP_H)]
+            map_lines.append("└" + "─" * self.MAP_W + "┘")
+            self._map_key = (x1, x2, y1, y2)
+            self._map_lines = map_lines
+        map_lines = self._map_lines
 
         # Status line
         src_str = f"{sw}x{sh}" if sw > 0 else "?"
@@ -221,7 +374,7 @@ class StatusUI:
         padding = " " * pad_left
 
         # Build output with cursor positioning
-        output = ""
+        output = []
         row = start_row
 
         # Log area first (above minimap)
@@ -230,26 +383,26 @@ class StatusUI:
         for i in range(self.LOG_LINES):
             if i < len(log_display):
                 msg = log_display[i][:log_width]  # Truncate to fit
-                output += f"\033[{row};1H\033[K{' ' * log_pad}\033[90m{msg}\033[0m"
+                output.append(f"\033[{row};1H\033[K{' ' * log_pad}\033[90m{msg}\033[0m")
             else:
-                output += f"\033[{row};1H\033[K"
+                output.append(f"\033[{row};1H\033[K")
             row += 1
 
         # Minimap
         for line in map_lines:
-            output += f"\033[{row};1H\033[K{padding}{line}"
+            output.append(f"\033[{row};1H\033[K{padding}{line}")
             row += 1
 
         # Status (centered separately since it has different width)
         status_pad = max(0, (term_w - 60) // 2)
-        output += f"\033[{row};1H\033[K{' ' * status_pad}{status}"
+        output.append(f"\033[{row};1H\033[K{' ' * status_pad}{status}")
         row += 1
 
         # Help line
         help_pad = max(0, (term_w - 55) // 2)
-        output += f"\033[{row};1H\033[K{' ' * help_pad}{help_line}"
+        output.append(f"\033[{row};1H\033[K{' ' * help_pad}{help_line}")
 
-        sys.stdout.write(output)
+        sys.stdout.write("".join(output))
         sys.stdout.flush()
 
     def message(self, msg):
@@ -259,6 +412,8 @@ class StatusUI:
 
     def clear(self):
         """Clear and restore terminal."""
+        with self._lock:
+            self._started = False  # No more redraws, including a pending flush
         # Show cursor, clear screen
         sys.stdout.write("\033[?25h\033[2J\033[H")
         sys.stdout.flush()
@@ -284,26 +439,47 @@ def find_pico_serial_port():
 SERIAL_CMD_FRAME = 0xFE
 SERIAL_CMD_DELTA = 0xFD
 SERIAL_CMD_BRIGHTNESS = 0xFC
+SERIAL_CMD_FRAME565 = 0xFB   # 0xFB + 2048 bytes RGB565 (LE)
+SERIAL_CMD_DELTA565 = 0xFA   # 0xFA + u16 count + (u16 idx, u16 rgb565) * count
 SERIAL_RESP_OK = 0x01
 SERIAL_RESP_BUSY = 0x02
 SERIAL_RESP_ERROR = 0x03
+RAW_PORT = 5001  # Raw TCP frame stream, same packets as serial
 
 
 class SerialFrameSender:
-    """Send frames over USB CDC serial - lower latency than WiFi."""
+    """Send frames over USB CDC serial - lower latency than WiFi.
+
+    Frames are pipelined: up to MAX_INFLIGHT packets may be awaiting their
+    1-byte ack, which a reader thread drains so send() never waits on a
+    USB round-trip unless the device falls behind.
+    """
 
     DELTA_THRESHOLD = 150
+    MAX_INFLIGHT = 4
+    ACK_TIMEOUT = 0.1  # Max wait for a credit before treating acks as lost
 
-    def __init__(self, port):
+    def __init__(self, port, pixel_format="rgb888"):
         self.port = port
+        # RGB565 frames come straight from GStreamer (RGB16 caps) and cut
+        # full frames from 3072 to 2048 bytes and delta entries from 5 to 4
+        if pixel_format == "rgb565":
+            self.frame_size = FRAME_SIZE_565
+            self._pixel = np.dtype("<u2")  # Compare each pixel as one word
+            self._entry = DELTA_ENTRY_565
+            cmd_frame, cmd_delta = SERIAL_CMD_FRAME565, SERIAL_CMD_DELTA565
+        else:
+            self.frame_size = FRAME_SIZE
+            self._pixel = np.dtype((np.uint8, 3))  # Views as (1024, 3) bytes
+            self._entry = DELTA_ENTRY
+            cmd_frame, cmd_delta = SERIAL_CMD_FRAME, SERIAL_CMD_DELTA
         # USB CDC ignores baud rate - runs at USB full speed (12 Mbps)
         # Set high value anyway for documentation
         self.ser = serial.Serial(port, 921600, timeout=0.1)
         # Disable output buffering for lower latency
         self.ser.write_timeout = 0.05
         self.prev_frame = None
-        self.prev_crc = None
-        self._pending_crc = None
+        self._prev_arr = None  # Per-pixel view of prev_frame (see self._pixel)
         self.mode = "auto"
         # Stats
         self.stats_delta = 0
@@ -311,106 +487,185 @@ class SerialFrameSender:
         self.stats_skipped = 0
         self.stats_stalls = 0
         self.stats_bytes = 0
+        # Full frames go out as cmd byte + caller's buffer in one writev (POSIX);
+        # elsewhere they are copied behind the cmd byte in _frame_buf
+        self._fd = self.ser.fileno() if hasattr(os, "writev") and hasattr(self.ser, "fileno") else None
+        self._cmd_frame = bytes((cmd_frame,))
         # Pre-allocated buffers to avoid allocations in hot path
-        self._frame_buf = bytearray(1 + FRAME_SIZE)  # cmd + frame
-        self._frame_buf[0] = SERIAL_CMD_FRAME
-        self._delta_buf = bytearray(3 + 1024 * 5)  # cmd + count + entries
-        self._delta_buf[0] = SERIAL_CMD_DELTA
+        self._frame_buf = bytearray(1 + self.frame_size)  # cmd + frame
+        self._frame_buf[0] = cmd_frame
+        self._delta_buf = bytearray(3 + 1024 * self._entry.itemsize)  # cmd + count + entries
+        self._delta_buf[0] = cmd_delta
+        self._neq = np.empty((WIDTH * HEIGHT, 3), dtype=bool)  # Delta scratch
+        self._changed = np.empty(WIDTH * HEIGHT, dtype=bool)
         self._stats = {
             "delta": 0, "full": 0, "skipped": 0, "stalls": 0,
             "total": 0, "bytes": 0, "delta_pct": 0.0
         }
+        # Credit-based pipelining: one credit per packet awaiting an ack.
+        # Bounded so a stray extra release fails loudly instead of raising
+        # the window past MAX_INFLIGHT.
+        self._credits = threading.BoundedSemaphore(self.MAX_INFLIGHT)
+        self._inflight = deque()  # (generation, kind, bytes) per packet, in send order
+        self._outstanding = 0  # Credits taken in the current generation, not yet returned
+        self._generation = 0  # Bumped by _reset_credits; older entries are stale
+        self._inflight_lock = threading.Lock()
+        self._resync = False  # Set when the device rejected a frame
+        self._running = True
+        self._reader = threading.Thread(target=self._ack_reader, daemon=True)
+        self._reader.start()
 
     def send(self, rgb_data):
         """Send frame, using delta encoding when beneficial."""
+        if self._resync:
+            # Device state is unknown after a rejected frame - send it whole
+            self._resync = False
+            self.prev_frame = None
+
         if self.mode == "full":
             return self._send_full(rgb_data)
 
-        # Check for identical frame
-        frame_crc = zlib.crc32(rgb_data)
-        self._pending_crc = frame_crc
-        if self.prev_frame is not None and frame_crc == self.prev_crc:
-            self.stats_skipped += 1
-            return True
-
-        # Try delta
-        if self.prev_frame is not None and self.mode != "full":
+        # Try delta - the same compare pass detects identical frames
+        if self.prev_frame is not None:
             delta = self._build_delta(rgb_data)
-            if delta is not None and len(delta) < FRAME_SIZE:
+            if delta == b'':
+                self.stats_skipped += 1
+                return True
+            if delta is not None and len(delta) < self.frame_size:
                 return self._send_delta(rgb_data, delta)
 
         return self._send_full(rgb_data)
 
-    def _send_full(self, rgb_data):
-        """Send full frame over serial."""
+    def _write(self, packet, kind, payload=None):
+        """Write a packet (+ optional payload) once a credit is free.
+
+        The ack reader returns credits.
+        """
+        if not self._credits.acquire(timeout=self.ACK_TIMEOUT):
+            # Acks stopped coming back - assume they were lost and start over
+            self._reset_credits()
+            self.stats_stalls += 1
+            return False
+        nbytes = len(packet) if payload is None else len(packet) + len(payload)
+        with self._inflight_lock:
+            entry = (self._generation, kind, nbytes)
+            self._inflight.append(entry)
+            self._outstanding += 1
         try:
-            # Copy frame data into pre-allocated buffer (avoids allocation)
-            self._frame_buf[1:] = rgb_data
-            self.ser.write(self._frame_buf)
-            resp = self.ser.read(1)
-            if resp and resp[0] == SERIAL_RESP_OK:
-                self.prev_frame = rgb_data
-                self.prev_crc = self._pending_crc or zlib.crc32(rgb_data)
-                self.stats_full += 1
-                self.stats_bytes += FRAME_SIZE + 1
-                return True
-            elif resp and resp[0] == SERIAL_RESP_BUSY:
-                self.stats_skipped += 1
-                return True
+            if payload is None:
+                self.ser.write(packet)
             else:
-                self.stats_stalls += 1
-                return False
+                self._writev(packet, payload, nbytes)
+            return True
         except Exception:
+            with self._inflight_lock:
+                # Nothing went out, so no ack will come - take the entry back
+                if self._inflight and self._inflight[-1] is entry:
+                    self._inflight.pop()
+                    self._outstanding -= 1
+                    self._credits.release()
+            self._resync = True
             self.stats_stalls += 1
             return False
 
-    def _build_delta(self, rgb_data):
-        """Build delta packet in pre-allocated buffer."""
-        buf = self._delta_buf
-        count = 0
-        offset = 3  # 1 cmd + 2 count (cmd already set in __init__)
-
-        prev = self.prev_frame
-        threshold = self.DELTA_THRESHOLD
-        for i in range(0, FRAME_SIZE, 3):
-            if (rgb_data[i] != prev[i] or
-                rgb_data[i+1] != prev[i+1] or
-                rgb_data[i+2] != prev[i+2]):
-                struct.pack_into('<HBBB', buf, offset, i // 3,
-                                 rgb_data[i], rgb_data[i+1], rgb_data[i+2])
-                offset += 5
-                count += 1
-                if count > threshold:
-                    return None  # Too many changes
+    def _writev(self, header, payload, nbytes):
+        """Gather-write header + payload straight to the port's fd."""
+        try:
+            sent = os.writev(self._fd, (header, payload))
+        except BlockingIOError:
+            sent = 0
+        if sent < nbytes:
+            # Short write on the non-blocking port - pyserial waits out the rest
+            self.ser.write((bytes(header) + bytes(payload))[sent:])
+
+    def _reset_credits(self):
+        """Forget in-flight frames and return their credits.
+
+        Bumping the generation tells the ack reader that any entry it popped
+        before the reset has had its credit returned here already.
+        """
+        with self._inflight_lock:
+            self._inflight.clear()
+            self._generation += 1
+            for _ in range(self._outstanding):
+                self._credits.release()
+            self._outstanding = 0
+        self._resync = True
+
+    def _ack_reader(self):
+        """Drain 1-byte acks (in send order), updating stats and returning credits."""
+        while self._running:
+            try:
+                resp = self.ser.read(1)
+            except Exception:
+                break
+            if not resp:
+                continue  # Read timeout, nothing in flight
+            with self._inflight_lock:
+                if not self._inflight:
+                    continue  # Late ack for a frame dropped by _reset_credits
+                generation, kind, nbytes = self._inflight.popleft()
+            if resp[0] == SERIAL_RESP_OK:
+                if kind == "delta":
+                    self.stats_delta += 1
+                else:
+                    self.stats_full += 1
+                self.stats_bytes += nbytes
+            elif resp[0] == SERIAL_RESP_BUSY:
+                self.stats_skipped += 1
+                self._resync = True  # Device didn't apply it, deltas would drift
+            else:
+                self.stats_stalls += 1
+                self._resync = True
+            with self._inflight_lock:
+                if generation != self._generation:
+                    continue  # _reset_credits already returned this credit
+                self._outstanding -= 1
+                self._credits.release()
 
+    def _send_full(self, rgb_data):
+        """Queue full frame over serial."""
+        if self._fd is not None:
+            ok = self._write(self._cmd_frame, "full", rgb_data)
+        else:
+            # Copy frame data into pre-allocated buffer (avoids allocation)
+            self._frame_buf[1:] = rgb_data
+            ok = self._write(self._frame_buf, "full")
+        if not ok:
+            return False
+        # Assume the device applies it; a failed ack forces a full-frame resync
+        self.prev_frame = rgb_data
+        self._prev_arr = np.frombuffer(rgb_data, dtype=self._pixel)
+        return True
+
+    def _build_delta(self, rgb_data):
+        """Build delta packet in pre-allocated buffer, b'' if the frame is unchanged."""
+        # Per-pixel change mask computed in NumPy instead of a 1024-step Python loop
+        cur = np.frombuffer(rgb_data, dtype=self._pixel)
+        changed = changed_pixels(cur, self._prev_arr, self._neq, self._changed,
+                                 self.DELTA_THRESHOLD)
+        if changed is None:
+            return None  # Too many changes
+        count = changed.size
         if count == 0:
-            return None  # No changes - will be caught by CRC check
+            return b''  # Identical frame, skip
 
-        struct.pack_into('<H', buf, 1, count)
+        # Pack entries straight into the buffer after cmd + count (cmd set in __init__)
+        buf = self._delta_buf
+        entries = np.frombuffer(buf, dtype=self._entry, count=count, offset=3)
+        entries["index"] = changed
+        entries["rgb"] = cur[changed]
+        DELTA_COUNT.pack_into(buf, 1, count)
         # Return memoryview to avoid copy
-        return memoryview(buf)[:offset]
+        return memoryview(buf)[:3 + count * self._entry.itemsize]
 
     def _send_delta(self, rgb_data, delta):
-        """Send delta frame over serial."""
-        try:
-            delta_len = len(delta)
-            self.ser.write(delta)
-            resp = self.ser.read(1)
-            if resp and resp[0] == SERIAL_RESP_OK:
-                self.prev_frame = rgb_data
-                self.prev_crc = self._pending_crc or zlib.crc32(rgb_data)
-                self.stats_delta += 1
-                self.stats_bytes += delta_len
-                return True
-            elif resp and resp[0] == SERIAL_RESP_BUSY:
-                self.stats_skipped += 1
-                return True
-            else:
-                self.stats_stalls += 1
-                return False
-        except Exception:
-            self.stats_stalls += 1
+        """Queue delta frame over serial."""
+        if not self._write(delta, "delta"):
             return False
+        self.prev_frame = rgb_data
+        self._prev_arr = np.frombuffer(rgb_data, dtype=self._pixel)
+        return True
 
     def get_stats(self):
         """Return stats dict."""
@@ -425,9 +680,26 @@ class SerialFrameSender:
         return self._stats
 
     def close(self):
+        self._running = False
+        self._reader.join(timeout=0.5)
         self.ser.close()
 
 
+def tune_stream_socket(sock):
+    """Prioritize packets on a frame-streaming TCP socket for low latency."""
+    sock.settimeout(0.1)  # 100ms timeout for requests - fail fast
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_PRIORITY, 6)   # 0-7, higher = more priority
+    sock.setsockopt(socket.IPPROTO_IP, socket.IP_TOS, 0x10)     # IPTOS_LOWDELAY
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)  # Send immediately, don't batch
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1) # Disable delayed ACKs
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 4096)  # Smaller send buffer for lower latency
+    # Aggressive keepalive to detect dead connections faster
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 1)   # Start keepalive after 1s idle
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 1)  # 1s between probes
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 2)    # 2 failed probes = dead
+
+
 class FrameSender:
     """Persistent HTTP connection to the Cosmic Unicorn."""
 
@@ -435,16 +707,25 @@ class FrameSender:
     # Delta format: 2 bytes count + 5 bytes per pixel (2 index + 3 RGB)
     # Full frame: 3072 bytes. Break-even at (3072 - 2) / 5 = 614 pixels
     # But perf testing shows delta only faster when ~100+ pixels change,
-    # so we use a lower threshold to prefer full frames for small changes
+    # so we use a lower threshold to prefer full frames for small changes.
+    # This is only the starting point: the live threshold follows measured
+    # send times, clamped to [MIN_DELTA_THRESHOLD, byte break-even]
     DELTA_THRESHOLD = 150
+    MIN_DELTA_THRESHOLD = 50
+    MAX_DELTA_THRESHOLD = (FRAME_SIZE - 2) // 5
+    SEND_EWMA_ALPHA = 0.1
 
     def __init__(self, host, mode="auto"):
         self.host = host
         self.conn = None
         self.prev_frame = None
-        self.prev_crc = None  # Fast identical-frame detection
-        self._pending_crc = None  # CRC computed in _build_delta, reused in send
+        self._prev_arr = None  # (1024, 3) uint8 view of prev_frame
         self.mode = mode  # "auto", "delta", "full"
+        # Send cost model: EWMA of full-frame send time, and EWMA moments
+        # [count, us, count^2, count*us] of deltas for a linear fit
+        self.delta_threshold = self.DELTA_THRESHOLD
+        self._full_us = None
+        self._delta_moments = None
         # Stats
         self.stats_delta = 0
         self.stats_full = 0
@@ -453,6 +734,8 @@ class FrameSender:
         self.stats_bytes = 0
         # Pre-allocated buffers to avoid allocations in hot path
         self._delta_buf = bytearray(2 + 1024 * 5)  # Max delta size
+        self._neq = np.empty((WIDTH * HEIGHT, 3), dtype=bool)  # Delta scratch
+        self._changed = np.empty(WIDTH * HEIGHT, dtype=bool)
         self._headers = {"Content-Type": "application/octet-stream"}
         # Reusable stats dict to avoid allocations in tight loop
         self._stats = {
@@ -463,60 +746,50 @@ class FrameSender:
     def _connect(self):
         self.conn = http.client.HTTPConnection(self.host, timeout=2.0)  # 2s for initial connect
         self.conn.connect()
-        # Prioritize packets for low-latency streaming
-        sock = self.conn.sock
-        sock.settimeout(0.1)  # 100ms timeout for requests - fail fast
-        sock.setsockopt(socket.SOL_SOCKET, socket.SO_PRIORITY, 6)   # 0-7, higher = more priority
-        sock.setsockopt(socket.IPPROTO_IP, socket.IP_TOS, 0x10)     # IPTOS_LOWDELAY
-        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)  # Send immediately, don't batch
-        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1) # Disable delayed ACKs
-        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 4096)  # Smaller send buffer for lower latency
-        # Aggressive keepalive to detect dead connections faster
-        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
-        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 1)   # Start keepalive after 1s idle
-        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 1)  # 1s between probes
-        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 2)    # 2 failed probes = dead
+        tune_stream_socket(self.conn.sock)
+
+    def _post(self, is_delta, body):
+        """POST one frame. Returns "ok", "busy", or None on an error status."""
+        if self.conn is None:
+            self._connect()
+        endpoint = "/api/delta" if is_delta else "/api/frame"
+        self.conn.request("POST", endpoint, body=body, headers=self._headers)
+        resp = self.conn.getresponse()
+        resp_body = resp.read()
+        if resp.status != 200:
+            return None
+        # Busy: device still drawing previous frame
+        return "busy" if b'"busy"' in resp_body else "ok"
 
     def _build_delta(self, rgb_data):
         """Compare with previous frame, return packed delta bytes or None if full frame needed."""
         if self.prev_frame is None or len(self.prev_frame) != FRAME_SIZE:
-            self._pending_crc = None
             return None  # No previous frame or size mismatch, send full
 
-        # Fast path: CRC check for identical frames (common with static content)
-        frame_crc = zlib.crc32(rgb_data)
-        self._pending_crc = frame_crc  # Cache for reuse in send()
-        if frame_crc == self.prev_crc:
-            return b''  # Identical frame, skip
+        # Per-pixel change mask computed in NumPy instead of a 1024-step Python loop
+        cur = np.frombuffer(rgb_data, dtype=np.uint8).reshape(-1, 3)
+        changed = changed_pixels(cur, self._prev_arr, self._neq, self._changed,
+                                 self.delta_threshold)
+        if changed is None:
+            return None  # Too many changes, send full frame
+        count = changed.size
+        # Skip if 5 or fewer pixels changed (likely noise/artifacts)
+        if count <= 5:
+            return b''
 
-        # Reuse pre-allocated buffer
+        # Pack entries into pre-allocated buffer, return view of it (no copy)
         buf = self._delta_buf
-        count = 0
-        offset = 2
-
-        prev = self.prev_frame
-        for i in PIXEL_RANGE:
-            if (rgb_data[i] != prev[i] or
-                rgb_data[i+1] != prev[i+1] or
-                rgb_data[i+2] != prev[i+2]):
-                struct.pack_into('<HBBB', buf, offset, i // 3,
-                                 rgb_data[i], rgb_data[i+1], rgb_data[i+2])
-                offset += 5
-                count += 1
-                if count > self.DELTA_THRESHOLD:
-                    return None  # Too many changes, send full frame
-
-        # Write count at start, return view of buffer (no copy)
-        # Skip if 5 or fewer pixels changed (likely noise/artifacts)
-        struct.pack_into('<H', buf, 0, count)
-        return memoryview(buf)[:offset] if count > 5 else b''
+        entries = np.frombuffer(buf, dtype=DELTA_ENTRY, count=count, offset=2)
+        entries["index"] = changed
+        entries["rgb"] = cur[changed]
+        DELTA_COUNT.pack_into(buf, 0, count)
+        return memoryview(buf)[:2 + count * DELTA_ENTRY.itemsize]
 
     def send(self, rgb_data):
         """POST frame data. Uses delta encoding when beneficial."""
         # Determine what to send based on mode
         if self.mode == "full":
             # Force full frame
-            endpoint = "/api/frame"
             body = rgb_data
             is_delta = False
         else:
@@ -528,43 +801,79 @@ class FrameSender:
                 return True
             if delta is not None and (self.mode == "delta" or len(delta) < FRAME_SIZE):
                 # Use delta (forced in delta mode, or smaller in auto mode)
-                endpoint = "/api/delta"
                 body = delta
                 is_delta = True
             else:
                 # No previous frame or delta too large
-                endpoint = "/api/frame"
                 body = rgb_data
                 is_delta = False
 
         for attempt in range(2):
+            # A send that has to reconnect first times the handshake, not the
+            # frame, so it is left out of the cost model
+            reconnected = self.conn is None
+            t_send = time.perf_counter()
             try:
-                if self.conn is None:
-                    self._connect()
-                self.conn.request("POST", endpoint, body=body,
-                                  headers=self._headers)
-                resp = self.conn.getresponse()
-                resp_body = resp.read()
-                if resp.status == 200:
-                    # Check for busy response (device still drawing previous frame)
-                    if b'"busy"' in resp_body:
-                        self.stats_skipped += 1
-                        return True  # Not an error, just skip
-                    self.prev_frame = rgb_data
-                    # Reuse CRC from _build_delta if available, else compute
-                    self.prev_crc = self._pending_crc or zlib.crc32(rgb_data)
-                    self.stats_bytes += len(body)
-                    if is_delta:
-                        self.stats_delta += 1
-                    else:
-                        self.stats_full += 1
-                    return True
-                return False
+                result = self._post(is_delta, body)
             except Exception:
                 self.conn = None  # reconnect on next attempt
                 self.stats_stalls += 1
+                continue
+            if result == "busy":
+                self.stats_skipped += 1
+                return True  # Not an error, just skip
+            if result == "ok":
+                self.prev_frame = rgb_data
+                self._prev_arr = np.frombuffer(rgb_data, dtype=np.uint8).reshape(-1, 3)
+                self.stats_bytes += len(body)
+                if is_delta:
+                    self.stats_delta += 1
+                else:
+                    self.stats_full += 1
+                if not reconnected:
+                    self._update_threshold(is_delta, len(body),
+                                           (time.perf_counter() - t_send) * 1e6)
+                return True
+            return False
         return False
 
+    def _update_threshold(self, is_delta, nbytes, send_us):
+        """Fold a send time into the cost model and re-derive delta_threshold.
+
+        Delta cost is fitted as fixed + per_pixel * count; the threshold is the
+        count where that crosses the average full-frame send time.
+        """
+        alpha = self.SEND_EWMA_ALPHA
+        if not is_delta:
+            if self._full_us is None:
+                self._full_us = send_us
+            else:
+                self._full_us += alpha * (send_us - self._full_us)
+        else:
+            count = (nbytes - 2) // 5
+            sample = (count, send_us, count * count, count * send_us)
+            if self._delta_moments is None:
+                self._delta_moments = list(sample)
+            else:
+                moments = self._delta_moments
+                for i in range(4):
+                    moments[i] += alpha * (sample[i] - moments[i])
+        if self._full_us is None or self._delta_moments is None:
+            return
+
+        mean_n, mean_us, mean_nn, mean_nus = self._delta_moments
+        var = mean_nn - mean_n * mean_n
+        if var < 1.0:
+            return  # Counts too uniform to fit a slope yet
+        per_pixel = (mean_nus - mean_n * mean_us) / var
+        if per_pixel <= 0:
+            threshold = self.MAX_DELTA_THRESHOLD  # Count doesn't cost time, bytes decide
+        else:
+            fixed = mean_us - per_pixel * mean_n
+            threshold = (self._full_us - fixed) / per_pixel
+        self.delta_threshold = int(min(max(threshold, self.MIN_DELTA_THRESHOLD),
+                                       self.MAX_DELTA_THRESHOLD))
+
     def get_stats(self):
         """Return stats dict (reuses internal dict to avoid allocations)."""
         total = self.stats_delta + self.stats_full + self.stats_skipped
@@ -578,6 +887,44 @@ class FrameSender:
         return self._stats
 
 
+class RawFrameSender(FrameSender):
+    """FrameSender over the firmware's raw TCP frame stream.
+
+    Same packets as USB serial (0xFE + u16 length + RGB, 0xFD + u16 count +
+    entries) answered by a 1-byte status, so there are no HTTP headers to
+    build or parse per frame. Connects on creation and raises if the firmware
+    has no raw stream, so callers can fall back to HTTP.
+    """
+
+    def __init__(self, host, port=RAW_PORT, mode="auto"):
+        super().__init__(host, mode=mode)
+        self.port = port
+        self._full_hdr = bytes((SERIAL_CMD_FRAME,)) + DELTA_COUNT.pack(FRAME_SIZE)
+        self._delta_hdr = bytes((SERIAL_CMD_DELTA,))  # Delta body starts with its count
+        self._resp = bytearray(1)
+        self._connect()
+
+    def _connect(self):
+        self.conn = socket.create_connection((self.host, self.port), timeout=2.0)
+        tune_stream_socket(self.conn)
+
+    def _post(self, is_delta, body):
+        """Send one packet. Returns "ok", "busy", or None on an error status."""
+        if self.conn is None:
+            self._connect()
+        hdr = self._delta_hdr if is_delta else self._full_hdr
+        # Header and payload in one syscall without concatenating them
+        sent = self.conn.sendmsg((hdr, body))
+        if sent < len(hdr) + len(body):
+            self.conn.sendall((hdr + bytes(body))[sent:])
+        if self.conn.recv_into(self._resp) != 1:
+            raise ConnectionError("device closed raw stream")
+        resp = self._resp[0]
+        if resp == SERIAL_RESP_OK:
+            return "ok"
+        return "busy" if resp == SERIAL_RESP_BUSY else None
+
+
 class PortalScreenCast:
     """Manages an XDG Desktop Portal ScreenCast session."""
 
@@ -689,6 +1036,32 @@ class PortalScreenCast:
         return self.pipewire_node, self.pipewire_fd
 
 
+def wifi_sender(args, status):
+    """Open the raw TCP frame stream, falling back to HTTP on older firmware."""
+    if not args.http:
+        try:
+            return RawFrameSender(args.host, mode=args.mode)
+        except OSError as e:
+            status.log(f"Raw stream unavailable ({e}), using HTTP")
+    return FrameSender(args.host, mode=args.mode)
+
+
+def cpu_pair(value):
+    """argparse type for --pin-cpus: two different CPUs this process may use."""
+    try:
+        cpus = tuple(int(c) for c in value.split(","))
+    except ValueError:
+        cpus = ()
+    if len(cpus) != 2 or cpus[0] == cpus[1]:
+        raise argparse.ArgumentTypeError("expected two different CPU numbers, e.g. 2,4")
+    if not hasattr(os, "sched_setaffinity"):
+        raise argparse.ArgumentTypeError("CPU pinning needs os.sched_setaffinity (Linux)")
+    unusable = sorted(set(cpus) - os.sched_getaffinity(0))
+    if unusable:
+        raise argparse.ArgumentTypeError(f"CPU {unusable[0]} is not in this process's affinity mask")
+    return cpus
+
+
 def main():
     parser = argparse.ArgumentParser(description="Screen capture to Cosmic Unicorn streamer")
     parser.add_argument("--host", default="cosmic.lan", help="Device hostname")
@@ -698,6 +1071,14 @@ def main():
                         help="Target frame rate (default: 100 for serial, 30 for WiFi)")
     parser.add_argument("--wifi", action="store_true",
                         help="Force WiFi mode even if serial is available")
+    parser.add_argument("--format", choices=["rgb888", "rgb565"], default="rgb888",
+                        help="Wire pixel format: rgb565 sends 2/3 the bytes (serial only)")
+    parser.add_argument("--http", action="store_true",
+                        help="Use the HTTP API over WiFi instead of the raw TCP stream")
+    parser.add_argument("--pin-cpus", type=cpu_pair, metavar="CAPTURE,SEND", default=None,
+                        help="Pin the capture callback and the send loop to these CPUs "
+                             "(default: no pinning). Pick two physical cores, not SMT "
+                             "siblings (see lscpu -e), and preferably not CPU 0")
     args = parser.parse_args()
 
     # Create and show status UI immediately
@@ -714,30 +1095,66 @@ def main():
     except Exception as e:
         status.log(f"WARNING: Can't reach {args.host}: {e}")
 
+    # Auto-detect serial connection (preferred) or fall back to WiFi.
+    # Done before building the pipeline since the sender decides the pixel format.
+    serial_port = find_pico_serial_port()
+    using_serial = False
+    if serial_port and not args.wifi:
+        try:
+            sender = SerialFrameSender(serial_port, pixel_format=args.format)
+            sender.mode = args.mode
+            using_serial = True
+        except Exception as e:
+            status.log(f"Serial failed ({e}), falling back to WiFi")
+            sender = wifi_sender(args, status)
+    else:
+        sender = wifi_sender(args, status)
+
+    # RGB565 is only understood by the serial protocol
+    use_565 = using_serial and args.format == "rgb565"
+    if args.format == "rgb565" and not use_565:
+        status.log("RGB565 needs serial, sending RGB888 over WiFi")
+    frame_size = FRAME_SIZE_565 if use_565 else FRAME_SIZE
+    caps_format = "RGB16" if use_565 else "RGB"
+
     # Set up portal screencast
     status.log("Setting up screen capture portal...")
     portal = PortalScreenCast(status)
     node_id, pw_fd = portal.start()
 
     # Pipeline: crop at native res (cheap, no format conversion yet),
-    # then videoconvert + scale only on the cropped region
+    # scale the cropped region down in the source format, then videoconvert
+    # only the 32x32 result - converting before scaling touched every native pixel
     pipeline_str = (
         f"pipewiresrc fd={pw_fd} path={node_id} ! "
         f"video/x-raw,pixel-aspect-ratio=1/1 ! "
         f"videocrop name=crop ! "
-        f"videoconvert ! "
         f"videoscale method=bilinear add-borders=false ! "
-        f"video/x-raw,format=RGB,width={WIDTH},height={HEIGHT},pixel-aspect-ratio=1/1 ! "
+        f"video/x-raw,width={WIDTH},height={HEIGHT},pixel-aspect-ratio=1/1 ! "
+        f"videoconvert ! "
+        f"video/x-raw,format={caps_format},width={WIDTH},height={HEIGHT},pixel-aspect-ratio=1/1 ! "
         f"appsink name=sink emit-signals=true drop=true max-buffers=1"
     )
     status.log(f"Pipeline ready, starting stream...")
 
     pipeline = Gst.parse_launch(pipeline_str)
     appsink = pipeline.get_by_name("sink")
-    crop_elem = pipeline.get_by_name("crop")
+    crop = CropState(pipeline.get_by_name("crop"))
 
-    # Stream dimensions (filled in by first frame)
-    stream_size = [0, 0]
+    # Native stream dimensions, replaced as one tuple whenever videocrop's sink
+    # pad (re)negotiates - readers never see a half-updated size, and a window
+    # resize on the PipeWire side is picked up without polling caps per frame
+    stream_size = (0, 0)
+
+    def on_stream_caps(pad, _pspec):
+        nonlocal stream_size
+        caps = pad.get_current_caps()
+        if caps:
+            s = caps.get_structure(0)
+            stream_size = (s.get_int("width").value, s.get_int("height").value)
+            status.log(f"Native stream: {stream_size[0]}x{stream_size[1]}")
+
+    crop.elem.get_static_pad("sink").connect("notify::caps", on_stream_caps)
 
     # Monitor pipeline bus for errors
     bus = pipeline.get_bus()
@@ -752,119 +1169,96 @@ def main():
             status.log(f"GStreamer WARNING: {err.message}")
     bus.connect("message", on_bus_message)
 
-    # Frame buffer shared between GStreamer callback and send loop
-    frame_buf = [None]
-    frame_id = [0]
-    frame_cond = threading.Condition()
-    crop_state = {"last_time": 0, "first": True, "locked": False}
+    # Mailbox between GStreamer callback and send loop; a byte on the
+    # self-pipe only wakes the sender
+    mailbox = FrameMailbox(frame_size)
+    wake_r, wake_w = os.pipe()
+    os.set_blocking(wake_r, False)
+    os.set_blocking(wake_w, False)
+
+    # --pin-cpus keeps capture and send on separate cores so they don't fight
+    # over one L1. Only those two threads are pinned: the GLib loop and the
+    # serial ack reader are already running and keep the process's mask.
+    capture_cpu, send_cpu = args.pin_cpus or (None, None)
+    capture_pinned = capture_cpu is None
+
+    crop_state = {"last_time": 0, "locked": False}
+
+    # GI enum lookups resolved once; on_new_sample runs for every frame
+    FLOW_OK = Gst.FlowReturn.OK
+    MAP_READ = Gst.MapFlags.READ
+    get_buffer = mailbox.get_buffer
+    put_frame = mailbox.put
+    os_write = os.write
 
     def on_new_sample(sink):
+        nonlocal capture_pinned
         sample = sink.emit("pull-sample")
         if sample is None:
-            return Gst.FlowReturn.OK
+            return FLOW_OK
         buf = sample.get_buffer()
-        ok, mapinfo = buf.map(Gst.MapFlags.READ)
+        ok, mapinfo = buf.map(MAP_READ)
         if not ok:
-            return Gst.FlowReturn.OK
-        data = bytes(mapinfo.data[:FRAME_SIZE])
+            return FLOW_OK
+        data = get_buffer()
+        memoryview(data)[:] = mapinfo.data[:frame_size]
         buf.unmap(mapinfo)
 
-        if crop_state["first"]:
-            # Get native stream size from pipewiresrc's src pad
-            pw_src = pipeline.get_by_name("crop")
-            pad = pw_src.get_static_pad("sink")
-            caps = pad.get_current_caps()
-            if caps:
-                s = caps.get_structure(0)
-                stream_size[0] = s.get_int("width").value
-                stream_size[1] = s.get_int("height").value
-                status.log(f"Native stream: {stream_size[0]}x{stream_size[1]}")
-            crop_state["first"] = False
+        if not capture_pinned:
+            # First callback runs on the GStreamer streaming thread - pin it
+            os.sched_setaffinity(0, {capture_cpu})
+            capture_pinned = True
 
         # Auto-crop disabled - use manual controls (wasd/arrows) or press 'r' to reset
         # The auto-detection was unreliable on 32x32 downscaled frames
 
-        with frame_cond:
-            frame_buf[0] = data
-            frame_id[0] += 1
-            frame_cond.notify()
-        return Gst.FlowReturn.OK
+        put_frame(data)
+        try:
+            os_write(wake_w, b"\x00")
+        except BlockingIOError:
+            pass  # Pipe already full of wakeups - the sender is behind anyway
+        return FLOW_OK
 
     def _update_crop(data, native_w, native_h):
         """Detect black borders + decorations on 32x32 frame, scale to native crop."""
         threshold = 30
-        stride = WIDTH * 3
-
-        # Scan from left
-        left = 0
-        for col in range(WIDTH):
-            for row in range(HEIGHT):
-                off = row * stride + col * 3
-                if data[off] + data[off+1] + data[off+2] > threshold:
-                    left = col
-                    break
-            else:
-                continue
-            break
-
-        # Scan from right
-        right = 0
-        for col in range(WIDTH - 1, left, -1):
-            for row in range(HEIGHT):
-                off = row * stride + col * 3
-                if data[off] + data[off+1] + data[off+2] > threshold:
-                    right = WIDTH - 1 - col
-                    break
-            else:
-                continue
-            break
-
-        # Scan from top
-        top = 0
-        for row in range(HEIGHT):
-            off = row * stride
-            if any(data[off+i] + data[off+i+1] + data[off+i+2] > threshold
-                   for i in range(0, stride, 3)):
-                top = row
-                break
-
-        # Scan from bottom
-        bottom = 0
-        for row in range(HEIGHT - 1, top, -1):
-            off = row * stride
-            if any(data[off+i] + data[off+i+1] + data[off+i+2] > threshold
-                   for i in range(0, stride, 3)):
-                bottom = HEIGHT - 1 - row
-                break
 
-        # Trim low-saturation decoration rows (title bar, status bar)
+        # Border scan on a (32, 32) brightness map instead of per-pixel loops.
+        # Work on the three channel planes: reducing over the length-3 pixel
+        # axis is several times slower than elementwise ops across planes.
+        frame = np.frombuffer(data, dtype=np.uint8).reshape(HEIGHT, WIDTH, 3)
+        r, g, b = frame[..., 0], frame[..., 1], frame[..., 2]
+        bright = r.astype(np.uint16) + g + b > threshold
+        cols = bright.any(axis=0)
+        rows = bright.any(axis=1)
+
+        # argmax finds the first True (0 if none); right/bottom only count
+        # content beyond left/top, matching the original scan ranges
+        left = int(np.argmax(cols))
+        right = int(np.argmax(cols[::-1])) if cols[left + 1:].any() else 0
+        top = int(np.argmax(rows))
+        bottom = int(np.argmax(rows[::-1])) if rows[top + 1:].any() else 0
+
+        # Trim low-saturation decoration rows (title bar, status bar): up to
+        # max_dec rows from each edge, stopping at the first saturated row
         content_h = HEIGHT - top - bottom
         max_dec = max(1, content_h // 8)
+        spread = np.maximum(np.maximum(r, g), b) - np.minimum(np.minimum(r, g), b)
+        sat_count = np.count_nonzero(spread > 40, axis=1)
+        saturated = sat_count * 5 > WIDTH  # > 20% of the row, without float division
 
-        for row in range(top, top + max_dec):
-            off = row * stride
-            sat_count = sum(1 for x in range(0, stride, 3)
-                           if max(data[off+x], data[off+x+1], data[off+x+2])
-                            - min(data[off+x], data[off+x+1], data[off+x+2]) > 40)
-            if sat_count / (WIDTH) > 0.2:
-                break
-            top = row + 1
-
-        for row in range(HEIGHT - 1 - bottom, HEIGHT - 1 - bottom - max_dec, -1):
-            off = row * stride
-            sat_count = sum(1 for x in range(0, stride, 3)
-                           if max(data[off+x], data[off+x+1], data[off+x+2])
-                            - min(data[off+x], data[off+x+1], data[off+x+2]) > 40)
-            if sat_count / (WIDTH) > 0.2:
-                break
-            bottom = HEIGHT - row
+        head = saturated[top:top + max_dec]
+        top += int(np.argmax(head)) if head.any() else max_dec
+        edge = HEIGHT - 1 - bottom
+        tail = saturated[edge - max_dec + 1:edge + 1][::-1]
+        bottom += int(np.argmax(tail)) if tail.any() else max_dec
 
         # Scale 32x32 crop values to native resolution
         # Account for current crop already applied
-        cur_l = crop_elem.get_property("left")
-        cur_r = crop_elem.get_property("right")
-        cur_t = crop_elem.get_property("top")
-        cur_b = crop_elem.get_property("bottom")
+        cur_l = crop.left
+        cur_r = crop.right
+        cur_t = crop.top
+        cur_b = crop.bottom
         cur_w = native_w - cur_l - cur_r
         cur_h = native_h - cur_t - cur_b
 
@@ -880,10 +1274,10 @@ def main():
         if new != old and content_w > 64 and content_h > 64:
             print(f"  Auto-crop: left={n_left} right={n_right} top={n_top} bottom={n_bottom} "
                   f"(content: {content_w}x{content_h})")
-            crop_elem.set_property("left", n_left)
-            crop_elem.set_property("right", n_right)
-            crop_elem.set_property("top", n_top)
-            crop_elem.set_property("bottom", n_bottom)
+            crop.set("left", n_left)
+            crop.set("right", n_right)
+            crop.set("top", n_top)
+            crop.set("bottom", n_bottom)
             return True
         return new != (0, 0, 0, 0)  # lock even if unchanged, as long as crop is non-zero
 
@@ -897,23 +1291,15 @@ def main():
     # Crop adjustment helpers
     NUDGE = 20  # pixels per keypress at native resolution
 
+    # side -> (opposite side, stream_size axis) for clamping
+    SIDE_AXIS = {"left": ("right", 0), "right": ("left", 0),
+                 "top": ("bottom", 1), "bottom": ("top", 1)}
+
     def nudge_crop(side, delta):
         """Adjust one side of the crop. Clamps to valid range."""
-        val = crop_elem.get_property(side) + delta
-        cur_l = crop_elem.get_property("left")
-        cur_r = crop_elem.get_property("right")
-        cur_t = crop_elem.get_property("top")
-        cur_b = crop_elem.get_property("bottom")
-        nw, nh = stream_size
-        if side == "left":
-            val = max(0, min(val, nw - cur_r - 64))
-        elif side == "right":
-            val = max(0, min(val, nw - cur_l - 64))
-        elif side == "top":
-            val = max(0, min(val, nh - cur_b - 64))
-        elif side == "bottom":
-            val = max(0, min(val, nh - cur_t - 64))
-        crop_elem.set_property(side, val)
+        opposite, axis = SIDE_AXIS[side]
+        limit = stream_size[axis] - getattr(crop, opposite) - 64
+        crop.set(side, max(0, min(getattr(crop, side) + delta, limit)))
 
     def move_crop(dx, dy):
         """Shift the crop region. Moves each axis independently. Returns action string."""
@@ -921,10 +1307,10 @@ def main():
         if nw <= 0 or nh <= 0:
             return "wait"
 
-        cur_l = crop_elem.get_property("left")
-        cur_r = crop_elem.get_property("right")
-        cur_t = crop_elem.get_property("top")
-        cur_b = crop_elem.get_property("bottom")
+        cur_l = crop.left
+        cur_r = crop.right
+        cur_t = crop.top
+        cur_b = crop.bottom
 
         msg = []
         # Move horizontally if dx != 0
@@ -936,8 +1322,8 @@ def main():
             elif nw - new_l - new_r < 64:
                 msg.append("H-min")
             else:
-                crop_elem.set_property("left", new_l)
-                crop_elem.set_property("right", new_r)
+                crop.set("left", new_l)
+                crop.set("right", new_r)
 
         # Move vertically if dy != 0
         if dy != 0:
@@ -948,63 +1334,63 @@ def main():
             elif nh - new_t - new_b < 64:
                 msg.append("V-min")
             else:
-                crop_elem.set_property("top", new_t)
-                crop_elem.set_property("bottom", new_b)
+                crop.set("top", new_t)
+                crop.set("bottom", new_b)
 
         return "pan" + (f" ({', '.join(msg)})" if msg else "")
 
     def do_recrop():
         """Reset crop to zero (full frame)."""
-        crop_elem.set_property("left", 0)
-        crop_elem.set_property("right", 0)
-        crop_elem.set_property("top", 0)
-        crop_elem.set_property("bottom", 0)
+        crop.set("left", 0)
+        crop.set("right", 0)
+        crop.set("top", 0)
+        crop.set("bottom", 0)
 
     def scroll_crop(dx, dy):
         """Scroll the view by adjusting crop asymmetrically. Always works."""
         nw, nh = stream_size
-        cur_l = crop_elem.get_property("left")
-        cur_r = crop_elem.get_property("right")
-        cur_t = crop_elem.get_property("top")
-        cur_b = crop_elem.get_property("bottom")
+        cur_l = crop.left
+        cur_r = crop.right
+        cur_t = crop.top
+        cur_b = crop.bottom
 
         # Scroll horizontally
         if dx > 0:  # scroll right - show content from right side
             new_l = cur_l + NUDGE
             new_r = max(0, cur_r - NUDGE)
             if nw - new_l - new_r >= 64:
-                crop_elem.set_property("left", new_l)
-                crop_elem.set_property("right", new_r)
+                crop.set("left", new_l)
+                crop.set("right", new_r)
         elif dx < 0:  # scroll left - show content from left side
             new_l = max(0, cur_l - NUDGE)
             new_r = cur_r + NUDGE
             if nw - new_l - new_r >= 64:
-                crop_elem.set_property("left", new_l)
-                crop_elem.set_property("right", new_r)
+                crop.set("left", new_l)
+                crop.set("right", new_r)
 
         # Scroll vertically
         if dy > 0:  # scroll down - show content from bottom
             new_t = cur_t + NUDGE
             new_b = max(0, cur_b - NUDGE)
             if nh - new_t - new_b >= 64:
-                crop_elem.set_property("top", new_t)
-                crop_elem.set_property("bottom", new_b)
+                crop.set("top", new_t)
+                crop.set("bottom", new_b)
         elif dy < 0:  # scroll up - show content from top
             new_t = max(0, cur_t - NUDGE)
             new_b = cur_b + NUDGE
             if nh - new_t - new_b >= 64:
-                crop_elem.set_property("top", new_t)
-                crop_elem.set_property("bottom", new_b)
+                crop.set("top", new_t)
+                crop.set("bottom", new_b)
 
     def zoom(delta):
         """Zoom in (positive delta) or out (negative delta) from center."""
         nw, nh = stream_size
         if nw <= 0 or nh <= 0:
             return
-        cur_l = crop_elem.get_property("left")
-        cur_r = crop_elem.get_property("right")
-        cur_t = crop_elem.get_property("top")
-        cur_b = crop_elem.get_property("bottom")
+        cur_l = crop.left
+        cur_r = crop.right
+        cur_t = crop.top
+        cur_b = crop.bottom
         # Calculate aspect-correct zoom (maintain current aspect ratio)
         cur_w = nw - cur_l - cur_r
         cur_h = nh - cur_t - cur_b
@@ -1020,10 +1406,10 @@ def main():
         new_b = max(0, cur_b + dv)
         # Ensure minimum size
         if nw - new_l - new_r >= 64 and nh - new_t - new_b >= 64:
-            crop_elem.set_property("left", new_l)
-            crop_elem.set_property("right", new_r)
-            crop_elem.set_property("top", new_t)
-            crop_elem.set_property("bottom", new_b)
+            crop.set("left", new_l)
+            crop.set("right", new_r)
+            crop.set("top", new_t)
+            crop.set("bottom", new_b)
 
     def crop_4_3():
         """Crop to 4:3 content centered in the window (removes pillarboxing)."""
@@ -1036,31 +1422,17 @@ def main():
             # Window is narrower than 4:3 - crop top/bottom instead
             target_h = int(nw * 3 / 4)
             side = (nh - target_h) // 2
-            crop_elem.set_property("left", 0)
-            crop_elem.set_property("right", 0)
-            crop_elem.set_property("top", side)
-            crop_elem.set_property("bottom", side)
+            crop.set("left", 0)
+            crop.set("right", 0)
+            crop.set("top", side)
+            crop.set("bottom", side)
         else:
             # Normal case: pillarboxing (black bars on sides)
             side = (nw - target_w) // 2
-            crop_elem.set_property("left", side)
-            crop_elem.set_property("right", side)
-            crop_elem.set_property("top", 0)
-            crop_elem.set_property("bottom", 0)
-
-    # Auto-detect serial connection (preferred) or fall back to WiFi
-    serial_port = find_pico_serial_port()
-    using_serial = False
-    if serial_port and not args.wifi:
-        try:
-            sender = SerialFrameSender(serial_port)
-            sender.mode = args.mode
-            using_serial = True
-        except Exception as e:
-            status.log(f"Serial failed ({e}), falling back to WiFi")
-            sender = FrameSender(args.host, mode=args.mode)
-    else:
-        sender = FrameSender(args.host, mode=args.mode)
+            crop.set("left", side)
+            crop.set("right", side)
+            crop.set("top", 0)
+            crop.set("bottom", 0)
 
     # Frame rate: use appropriate default based on connection type
     # Serial can handle ~100 FPS, WiFi tops out around 30 FPS
@@ -1086,7 +1458,11 @@ def main():
     frames_sent = 0
     send_errors = 0
     t_start = time.monotonic()
-    last_sent_id = 0
+    held_frame = None  # Pool buffer the sender holds as prev_frame
+
+    # Send loop runs on this thread; keep it off the capture core
+    if send_cpu is not None:
+        os.sched_setaffinity(0, {send_cpu})
 
     # Instantaneous FPS tracking (always on, rolling window)
     fps_tracker = InstantFPS(window_size=30)
@@ -1098,133 +1474,133 @@ def main():
     def update_status_crop(action=""):
         """Update status with current crop values."""
         nw, nh = stream_size
-        l = crop_elem.get_property("left")
-        r = crop_elem.get_property("right")
-        t = crop_elem.get_property("top")
-        b = crop_elem.get_property("bottom")
+        l = crop.left
+        r = crop.right
+        t = crop.top
+        b = crop.bottom
         cw = nw - l - r if nw > 0 else 0
         ch = nh - t - b if nh > 0 else 0
         status.update(crop=[l, r, t, b], source_size=[nw, nh], content_size=[cw, ch], action=action)
 
-    # Input handling with dedicated thread for reliable escape sequence parsing
-    key_queue = queue.Queue()
-    input_running = [True]
-
-    # Save terminal settings BEFORE any changes
+    # Keys are read on the send loop itself: one select() waits on stdin and
+    # the frame wake pipe together, so there is no input thread or key queue.
+    # stdin stays blocking - O_NONBLOCK would also hit stdout on the same tty,
+    # and os.read() on a ready fd returns whatever is buffered anyway.
     fd = sys.stdin.fileno()
     original_term_settings = termios.tcgetattr(fd)
-
-    def input_thread_func():
-        """Read keys in blocking mode and put parsed keys into queue."""
-        tty.setcbreak(fd)  # cbreak mode: char-at-a-time but keeps output processing
-        try:
-            while input_running[0]:
-                ch = sys.stdin.read(1)
-                if not ch or ch == '\x03':  # EOF or Ctrl+C
-                    break
-                if ch == '\x1b':  # Start of escape sequence
-                    # Read next two chars (blocking) - escape sequences are '[' + letter
-                    ch2 = sys.stdin.read(1)
-                    if ch2 == '[':
-                        ch3 = sys.stdin.read(1)
-                        key_queue.put(('arrow', ch3))
-                    else:
-                        # Not an arrow, put both chars
-                        key_queue.put(('key', ch2))
-                else:
-                    key_queue.put(('key', ch))
-        except Exception:
-            pass
-
-    input_thread = threading.Thread(target=input_thread_func, daemon=True)
-    input_thread.start()
+    tty.setcbreak(fd)  # cbreak mode: char-at-a-time but keeps output processing
+    key_buf = b""
+
+    selector = selectors.DefaultSelector()
+    selector.register(fd, selectors.EVENT_READ)
+    selector.register(wake_r, selectors.EVENT_READ)
+
+    def read_keys():
+        """Read pending stdin bytes and parse them into (type, value) keys."""
+        nonlocal key_buf
+        data = os.read(fd, 64)
+        if not data:  # EOF - stop watching stdin
+            selector.unregister(fd)
+            return []
+        key_buf += data
+        keys = []
+        i, n = 0, len(key_buf)
+        while i < n:
+            ch = key_buf[i]
+            if ch != 0x1b:
+                keys.append(('key', chr(ch)))
+                i += 1
+            elif i + 1 >= n or (key_buf[i + 1] == 0x5b and i + 2 >= n):
+                break  # Partial escape sequence - finish it on the next read
+            elif key_buf[i + 1] == 0x5b:  # ESC [ letter
+                keys.append(('arrow', chr(key_buf[i + 2])))
+                i += 3
+            else:
+                # Not an arrow, keep the second char
+                keys.append(('key', chr(key_buf[i + 1])))
+                i += 2
+        key_buf = key_buf[i:]
+        return keys
+
+    # Arrow letter -> pan offset, key -> (handler, args, status label)
+    arrow_moves = {'A': (0, -NUDGE), 'B': (0, NUDGE), 'C': (NUDGE, 0), 'D': (-NUDGE, 0)}
+    key_actions = {
+        'r': (do_recrop, (), "reset"),
+        '4': (crop_4_3, (), "4:3"),
+        '+': (zoom, (NUDGE,), "zoom+"),
+        '=': (zoom, (NUDGE,), "zoom+"),
+        '-': (zoom, (-NUDGE,), "zoom-"),
+        'a': (nudge_crop, ("left", NUDGE), "crop L+"),
+        'A': (nudge_crop, ("left", -NUDGE), "crop L-"),
+        'd': (nudge_crop, ("right", NUDGE), "crop R+"),
+        'D': (nudge_crop, ("right", -NUDGE), "crop R-"),
+        'w': (nudge_crop, ("top", NUDGE), "crop T+"),
+        'W': (nudge_crop, ("top", -NUDGE), "crop T-"),
+        's': (nudge_crop, ("bottom", NUDGE), "crop B+"),
+        'S': (nudge_crop, ("bottom", -NUDGE), "crop B-"),
+    }
+
+    def handle_key(key_type, key_val):
+        """Apply one key press, returning the action label for the status line."""
+        if key_type == 'arrow':
+            move = arrow_moves.get(key_val)
+            return move_crop(*move) if move else ""
+        entry = key_actions.get(key_val)
+        if entry is None:
+            return ""
+        handler, handler_args, action = entry
+        handler(*handler_args)
+        return action
+
+    # Per-frame lookups bound once as locals for the send loop
+    monotonic = time.monotonic
+    send = sender.send
+    recycle = mailbox.recycle
+    take_frame = mailbox.take
+    tick = fps_tracker.tick
 
     try:
         while True:
-            # Check for key input from queue (non-blocking)
-            action = ""
-            try:
-                key_type, key_val = key_queue.get_nowait()
-                if key_type == 'arrow':
-                    if key_val == 'A':    # up
-                        action = move_crop(0, -NUDGE)
-                    elif key_val == 'B':  # down
-                        action = move_crop(0, NUDGE)
-                    elif key_val == 'C':  # right
-                        action = move_crop(NUDGE, 0)
-                    elif key_val == 'D':  # left
-                        action = move_crop(-NUDGE, 0)
-                elif key_type == 'key':
-                    ch = key_val
-                    if ch == 'r':
-                        do_recrop()
-                        action = "reset"
-                    elif ch == '4':
-                        crop_4_3()
-                        action = "4:3"
-                    elif ch in ('+', '='):
-                        zoom(NUDGE)
-                        action = "zoom+"
-                    elif ch == '-':
-                        zoom(-NUDGE)
-                        action = "zoom-"
-                    elif ch == 'a':
-                        nudge_crop("left", NUDGE)
-                        action = "crop L+"
-                    elif ch == 'A':
-                        nudge_crop("left", -NUDGE)
-                        action = "crop L-"
-                    elif ch == 'd':
-                        nudge_crop("right", NUDGE)
-                        action = "crop R+"
-                    elif ch == 'D':
-                        nudge_crop("right", -NUDGE)
-                        action = "crop R-"
-                    elif ch == 'w':
-                        nudge_crop("top", NUDGE)
-                        action = "crop T+"
-                    elif ch == 'W':
-                        nudge_crop("top", -NUDGE)
-                        action = "crop T-"
-                    elif ch == 's':
-                        nudge_crop("bottom", NUDGE)
-                        action = "crop B+"
-                    elif ch == 'S':
-                        nudge_crop("bottom", -NUDGE)
-                        action = "crop B-"
-                if action:
-                    update_status_crop(action)
-            except queue.Empty:
-                pass
-
-            with frame_cond:
-                # Wait for new frame (with timeout to allow keyboard handling)
-                while frame_id[0] == last_sent_id:
-                    frame_cond.wait(timeout=0.01)
-                current_id = frame_id[0]
-                frame = frame_buf[0]
+            frame = None
+            # Wake in time to draw a throttled status update
+            for key, _ in selector.select(status.flush()):
+                if key.fd == wake_r:
+                    os.read(wake_r, 4096)  # Drain wakeups; only the newest frame matters
+                    frame = take_frame()  # None if taken on an earlier wakeup
+                    continue
+                for key_type, key_val in read_keys():
+                    action = handle_key(key_type, key_val)
+                    if action:
+                        update_status_crop(action)
+            if frame is None:
+                continue
 
             # Frame rate limiting
             if min_frame_interval > 0:
-                elapsed = time.monotonic() - last_send_time
+                elapsed = monotonic() - last_send_time
                 if elapsed < min_frame_interval:
                     time.sleep(min_frame_interval - elapsed)
-            last_send_time = time.monotonic()
-
-            t_send = time.monotonic()
-            ok = sender.send(frame)
-            send_ms = (time.monotonic() - t_send) * 1000
+            t_send = last_send_time = monotonic()
+            ok = send(frame)
+            now = monotonic()
+            send_ms = (now - t_send) * 1000
+
+            # Return buffers the sender no longer references to the pool
+            if sender.prev_frame is frame:
+                if held_frame is not None:
+                    recycle(held_frame)
+                held_frame = frame
+            else:
+                recycle(frame)
 
-            last_sent_id = current_id
             frames_sent += 1
             if not ok:
                 send_errors += 1
 
             # Record frame for instantaneous FPS calculation
-            fps_tracker.tick()
+            tick(now)
 
             # Time-based display update (decoupled from frame rate)
-            now = time.monotonic()
             if now - last_display_time >= DISPLAY_INTERVAL:
                 last_display_time = now
                 stats = sender.get_stats()
@@ -1237,7 +1613,7 @@ def main():
     except KeyboardInterrupt:
         pass
     finally:
-        input_running[0] = False
+        selector.close()
         # Restore terminal settings
         termios.tcsetattr(fd, termios.TCSADRAIN, original_term_settings)
         status.clear()
@@ -9,8 +9,9 @@ Run with: python cosmic_mock.py [--port 8080] [--scale 16]
 import argparse
 import socket
 import struct
+import sys
 import threading
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 
 # Try pygame first, fall back to tkinter
 try:
@@ -24,14 +25,26 @@ except ImportError:
 WIDTH = 32
 HEIGHT = 32
 FRAME_SIZE = WIDTH * HEIGHT * 3
+DELTA_ENTRY = struct.Struct("<H3s")  # u16 pixel index + RGB bytes, compiled once
 
 # Shared frame buffer
 frame_lock = threading.Lock()
 frame_data = bytearray(FRAME_SIZE)
+frame_mem = memoryview(frame_data)  # Fixed-size copy target; assigning never resizes
 frame_updated = threading.Event()
 
 
 class CosmicHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 so the Connection: keep-alive we advertise is actually honoured
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        # Per-connection landing buffer for full frames (reused across keep-alive requests)
+        self.body_buf = bytearray(FRAME_SIZE)
+        self.body_view = memoryview(self.body_buf)
+
     def log_message(self, format, *args):
         # Quieter logging
         pass
@@ -52,12 +65,16 @@ class CosmicHandler(BaseHTTPRequestHandler):
 
     def do_POST(self):
         content_length = int(self.headers.get("Content-Length", 0))
-        body = self.rfile.read(content_length)
+        if self.path == "/api/frame" and content_length == FRAME_SIZE:
+            # Read straight into body_buf - no bytes object per frame
+            body = self.body_view[:self.rfile.readinto(self.body_buf)]
+        else:
+            body = self.rfile.read(content_length)
 
         if self.path == "/api/frame":
             if len(body) == FRAME_SIZE:
                 with frame_lock:
-                    frame_data[:] = body
+                    frame_mem[:] = body
                 frame_updated.set()
                 self._send_ok()
             else:
@@ -65,19 +82,16 @@ class CosmicHandler(BaseHTTPRequestHandler):
 
         elif self.path == "/api/delta":
             if len(body) >= 2:
-                count = struct.unpack("<H", body[:2])[0]
-                offset = 2
+                mv = memoryview(body)
+                count = int.from_bytes(mv[:2], "little")
+                # Only whole entries; unpack them all in one C-level pass
+                count = min(count, (len(body) - 2) // DELTA_ENTRY.size)
+                entries = mv[2:2 + count * DELTA_ENTRY.size]
                 with frame_lock:
-                    for _ in range(count):
-                        if offset + 5 > len(body):
-                            break
-                        idx, r, g, b = struct.unpack("<HBBB", body[offset:offset+5])
-                        offset += 5
+                    for idx, rgb in DELTA_ENTRY.iter_unpack(entries):
                         if idx < WIDTH * HEIGHT:
                             base = idx * 3
-                            frame_data[base] = r
-                            frame_data[base + 1] = g
-                            frame_data[base + 2] = b
+                            frame_data[base:base + 3] = rgb
                 frame_updated.set()
                 self._send_ok()
             else:
@@ -87,28 +101,37 @@ class CosmicHandler(BaseHTTPRequestHandler):
 
 
 def run_server(port):
-    server = HTTPServer(("0.0.0.0", port), CosmicHandler)
+    server = ThreadingHTTPServer(("0.0.0.0", port), CosmicHandler)
     server.serve_forever()
 
 
 def run_udp_server(port):
     """UDP server for low-latency frame streaming"""
     sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    # Room for ~300 frames so bursts at 100 FPS aren't dropped while the
+    # display thread holds the GIL
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1024 * 1024)
     sock.bind(("0.0.0.0", port))
     print(f"UDP server listening on port {port}")
 
+    # Receive into one preallocated buffer - no bytes object per packet.
+    # One spare byte catches oversize packets; on Linux MSG_TRUNC also
+    # reports their real length without copying the rest.
+    buf = bytearray(FRAME_SIZE + 1)
+    view = memoryview(buf)
+    flags = socket.MSG_TRUNC if sys.platform.startswith("linux") else 0
     pkt_count = 0
     while True:
-        data, addr = sock.recvfrom(FRAME_SIZE + 64)  # Allow some overhead
+        nbytes, addr = sock.recvfrom_into(buf, 0, flags)
         pkt_count += 1
         if pkt_count <= 5 or pkt_count % 100 == 0:
-            print(f"UDP packet #{pkt_count} from {addr}: {len(data)} bytes")
-        if len(data) == FRAME_SIZE:
+            print(f"UDP packet #{pkt_count} from {addr}: {nbytes} bytes")
+        if nbytes == FRAME_SIZE:
             with frame_lock:
-                frame_data[:] = data
+                frame_mem[:] = view[:FRAME_SIZE]
             frame_updated.set()
         else:
-            print(f"  WARNING: Expected {FRAME_SIZE} bytes, got {len(data)}")
+            print(f"  WARNING: Expected {FRAME_SIZE} bytes, got {nbytes}")
 
 
 def run_pygame_display(scale):
@@ -118,7 +141,10 @@ def run_pygame_display(scale):
     pygame.display.set_caption("Cosmic Mock - 0 frames")
     clock = pygame.time.Clock()
 
-    surface = pygame.Surface((WIDTH, HEIGHT))
+    # The surface wraps a private snapshot buffer, so new frames are copied
+    # into it in place instead of allocating bytes and a surface per frame
+    snapshot = bytearray(FRAME_SIZE)
+    surface = pygame.image.frombuffer(snapshot, (WIDTH, HEIGHT), "RGB")
     running = True
     frames_received = 0
     last_fps_time = time.time()
@@ -133,12 +159,7 @@ def run_pygame_display(scale):
         if frame_updated.wait(timeout=0.05):
             frame_updated.clear()
             with frame_lock:
-                # Convert RGB bytes to pygame surface
-                for y in range(HEIGHT):
-                    for x in range(WIDTH):
-                        idx = (y * WIDTH + x) * 3
-                        r, g, b = frame_data[idx], frame_data[idx+1], frame_data[idx+2]
-                        surface.set_at((x, y), (r, g, b))
+                snapshot[:] = frame_data
             frames_received += 1
             fps_frame_count += 1
 
@@ -168,29 +189,25 @@ def run_tkinter_display(scale):
     canvas = tk.Canvas(root, width=WIDTH * scale, height=HEIGHT * scale, bg="black")
     canvas.pack()
 
-    # Pre-create rectangles for each pixel
-    rects = []
-    for y in range(HEIGHT):
-        row = []
-        for x in range(WIDTH):
-            r = canvas.create_rectangle(
-                x * scale, y * scale,
-                (x + 1) * scale, (y + 1) * scale,
-                fill="black", outline=""
-            )
-            row.append(r)
-        rects.append(row)
+    # One 32x32 photo filled by a single put() per frame, zoomed into the
+    # displayed image by Tk (instead of 1024 rectangle itemconfig calls)
+    photo = tk.PhotoImage(width=WIDTH, height=HEIGHT)
+    display = tk.PhotoImage(width=WIDTH * scale, height=HEIGHT * scale)
+    canvas.create_image(0, 0, anchor="nw", image=display)
+
+    row_chars = WIDTH * 8  # "#rrggbb " per pixel
 
     def update():
         if frame_updated.is_set():
             frame_updated.clear()
             with frame_lock:
-                for y in range(HEIGHT):
-                    for x in range(WIDTH):
-                        idx = (y * WIDTH + x) * 3
-                        r, g, b = frame_data[idx], frame_data[idx+1], frame_data[idx+2]
-                        color = f"#{r:02x}{g:02x}{b:02x}"
-                        canvas.itemconfig(rects[y][x], fill=color)
+                hexdata = frame_data.hex(" ", 3)
+            # Tk photo data: one {#rrggbb ...} list per row. hex() already
+            # spaced the pixels, so only rows are sliced in Python
+            pixels = "#" + hexdata.replace(" ", " #")
+            photo.put(" ".join(["{" + pixels[o:o + row_chars - 1] + "}"
+                                for o in range(0, len(pixels), row_chars)]))
+            display.tk.call(display, "copy", photo, "-zoom", scale, scale)
         root.after(16, update)  # ~60 FPS
 
     root.after(16, update)
@@ -6,26 +6,62 @@ Displays 32x32 frames using ANSI 24-bit color in the terminal.
 """
 
 import argparse
+import os
 import socket
 import struct
 import sys
 import threading
-from http.server import HTTPServer, BaseHTTPRequestHandler
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import numpy as np
 
 WIDTH = 32
 HEIGHT = 32
 FRAME_SIZE = WIDTH * HEIGHT * 3
 
+# Zero-padded decimal digits for 0..255. Fixed-width SGR parameters let a
+# whole frame of escape sequences be stamped out with NumPy indexing.
+DIGITS = np.array([list(b"%03d" % i) for i in range(256)], dtype=np.uint8)
+SGR_LEN = len(b"\033[38;2;000;000;000m")
+HALF_CELL = np.frombuffer(b"\033[38;2;000;000;000m\033[48;2;000;000;000m\xe2\x96\x80", dtype=np.uint8)
+HALF_SLOTS = (7, 11, 15, 26, 30, 34)  # Digit offsets: fg r,g,b then bg r,g,b
+FULL_CELL = np.frombuffer(b"\033[48;2;000;000;000m  ", dtype=np.uint8)
+FULL_SLOTS = (7, 11, 15)
+RESET = b"\033[0m"
+LOG_PREFIX = b"\033[4;1H\033[K"  # Cursor to line 4, clear it
+FRAME_TOP = 5  # Screen line of the first frame row
+FRAME_HOME = b"\033[%d;1H" % FRAME_TOP
+ROW_END = RESET + b"\n"
+RENDER_INTERVAL = 1 / 30  # Terminals (especially over SSH) can't usefully redraw faster
+
+DELTA_ENTRY = np.dtype([("index", "<u2"), ("rgb", "u1", 3)])  # Wire layout of '<HBBB'
+
 frame_lock = threading.Lock()
 frame_data = bytearray(FRAME_SIZE)
+# Persistent pixel view of frame_data (its size never changes, so the
+# exported buffer stays valid across the slice assignments below)
+frame_view = np.frombuffer(frame_data, dtype=np.uint8).reshape(HEIGHT, WIDTH, 3)
+frame_mem = memoryview(frame_data)
 frame_updated = threading.Event()
 frame_count = [0]
 
 
 class CosmicHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 so the Connection: keep-alive we advertise is actually honoured
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        # Per-connection landing buffer for full frames (reused across keep-alive requests)
+        self.body_buf = bytearray(FRAME_SIZE)
+        self.body_view = memoryview(self.body_buf)
+
     def log_message(self, format, *args):
-        # Show connection info on line 4
-        sys.stdout.write(f"\033[4;1H\033[K{self.client_address[0]}: {format % args}\033[0m")
+        # Show connection info on line 4, as one bytes write
+        line = f"{self.client_address[0]}: {format % args}".encode()
+        sys.stdout.buffer.write(LOG_PREFIX + line + RESET)
         sys.stdout.flush()
 
     def _send_ok(self, body=b"OK"):
@@ -44,12 +80,16 @@ class CosmicHandler(BaseHTTPRequestHandler):
 
     def do_POST(self):
         content_length = int(self.headers.get("Content-Length", 0))
-        body = self.rfile.read(content_length)
+        if self.path == "/api/frame" and content_length == FRAME_SIZE:
+            # Read straight into body_buf - no bytes object per frame
+            body = self.body_view[:self.rfile.readinto(self.body_buf)]
+        else:
+            body = self.rfile.read(content_length)
 
         if self.path == "/api/frame":
             if len(body) == FRAME_SIZE:
                 with frame_lock:
-                    frame_data[:] = body
+                    frame_mem[:] = body
                     frame_count[0] += 1
                 frame_updated.set()
                 self._send_ok()
@@ -59,18 +99,13 @@ class CosmicHandler(BaseHTTPRequestHandler):
         elif self.path == "/api/delta":
             if len(body) >= 2:
                 count = struct.unpack("<H", body[:2])[0]
-                offset = 2
+                # Parse every whole entry at once and scatter the in-range ones
+                count = min(count, (len(body) - 2) // DELTA_ENTRY.itemsize)
+                entries = np.frombuffer(body, dtype=DELTA_ENTRY, count=count, offset=2)
+                idx = entries["index"]
+                valid = idx < WIDTH * HEIGHT
                 with frame_lock:
-                    for _ in range(count):
-                        if offset + 5 > len(body):
-                            break
-                        idx, r, g, b = struct.unpack("<HBBB", body[offset:offset+5])
-                        offset += 5
-                        if idx < WIDTH * HEIGHT:
-                            base = idx * 3
-                            frame_data[base] = r
-                            frame_data[base + 1] = g
-                            frame_data[base + 2] = b
+                    frame_view.reshape(-1, 3)[idx[valid]] = entries["rgb"][valid]
                     frame_count[0] += 1
                 frame_updated.set()
                 self._send_ok()
@@ -81,97 +116,169 @@ class CosmicHandler(BaseHTTPRequestHandler):
 
 
 def run_server(port):
-    server = HTTPServer(("0.0.0.0", port), CosmicHandler)
+    server = ThreadingHTTPServer(("0.0.0.0", port), CosmicHandler)
     server.serve_forever()
 
 
-def run_udp_server(port):
+def run_udp_server(port, rcvbuf, reuseport=False):
     """UDP server for low-latency frame streaming"""
     sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    # Queue bursts while the render thread is stuck writing to a slow terminal.
+    # Linux caps this at net.core.rmem_max unless that sysctl is raised.
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, rcvbuf)
+    # Each --udp-workers thread binds its own socket; the kernel spreads
+    # datagrams across them. Only opt in when there are several workers so
+    # a lone mock still fails with EADDRINUSE if the port is taken.
+    if reuseport and hasattr(socket, "SO_REUSEPORT"):
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
     sock.bind(("0.0.0.0", port))
 
+    # One preallocated buffer per socket; the spare byte makes oversize
+    # packets show up as the wrong length
+    buf = bytearray(FRAME_SIZE + 1)
+    view = memoryview(buf)
     while True:
-        data, addr = sock.recvfrom(FRAME_SIZE + 64)
-        if len(data) == FRAME_SIZE:
+        nbytes = sock.recv_into(buf)
+        if nbytes == FRAME_SIZE:
             with frame_lock:
-                frame_data[:] = data
+                frame_mem[:] = view[:FRAME_SIZE]
                 frame_count[0] += 1
             frame_updated.set()
 
 
-def render_frame_half():
-    """Render using half-block chars (▀) - 2 pixels per char vertically."""
-    lines = []
-    with frame_lock:
-        for y in range(0, HEIGHT, 2):
-            line = ""
-            for x in range(WIDTH):
-                # Top pixel (foreground)
-                idx_top = (y * WIDTH + x) * 3
-                r1, g1, b1 = frame_data[idx_top], frame_data[idx_top+1], frame_data[idx_top+2]
-                # Bottom pixel (background)
-                idx_bot = ((y+1) * WIDTH + x) * 3
-                r2, g2, b2 = frame_data[idx_bot], frame_data[idx_bot+1], frame_data[idx_bot+2]
-                # Upper half block with fg=top, bg=bottom
-                line += f"\033[38;2;{r1};{g1};{b1}m\033[48;2;{r2};{g2};{b2}m▀"
-            line += "\033[0m"
-            lines.append(line)
-    return lines
-
-
-def render_frame_full():
-    """Render using full block chars (██) - 1 pixel per 2 chars."""
-    lines = []
-    with frame_lock:
-        for y in range(HEIGHT):
-            line = ""
-            for x in range(WIDTH):
-                idx = (y * WIDTH + x) * 3
-                r, g, b = frame_data[idx], frame_data[idx+1], frame_data[idx+2]
-                line += f"\033[48;2;{r};{g};{b}m  "
-            line += "\033[0m"
-            lines.append(line)
-    return lines
+def changed_color(pixels):
+    """Per-cell mask: True where a pixel differs from its left neighbour."""
+    changed = np.ones(pixels.shape[:-1], dtype=bool)
+    changed[..., 1:] = (pixels[..., 1:, :] != pixels[..., :-1, :]).any(axis=-1)
+    return changed
+
+
+class FrameRenderer:
+    """ANSI renderer for half-block (▀, 2 pixels per char) or full-block (██) cells.
+
+    Remembers the last drawn frame so small updates go out as cursor-addressed
+    patches of just the changed cells instead of a whole screen.
+    """
+
+    PATCH_LIMIT = 0.5  # Redraw the whole frame once more than half the cells changed
+
+    def __init__(self, full):
+        self.full = full
+        self.rows = HEIGHT if full else HEIGHT // 2
+        template, self.slots = (FULL_CELL, FULL_SLOTS) if full else (HALF_CELL, HALF_SLOTS)
+        # The whole screen as one byte array: each row is its cells followed by
+        # a reset + newline. Filled from the template once; renders rewrite just
+        # the digit slots and the SGR keep mask, then emit it with one tobytes().
+        row_cells = WIDTH * template.size
+        self.screen = np.empty((self.rows, row_cells + len(ROW_END)), dtype=np.uint8)
+        self.screen[:, :row_cells] = np.tile(template, WIDTH)
+        self.screen[:, row_cells:] = np.frombuffer(ROW_END, dtype=np.uint8)
+        self.keep = np.ones(self.screen.shape, dtype=bool)
+        # Per-cell views into the screen and its mask
+        self.cells = self.screen[:, :row_cells].reshape(self.rows, WIDTH, template.size)
+        self.cell_keep = self.keep[:, :row_cells].reshape(self.rows, WIDTH, template.size)
+        # Fixed-width cursor move to every cell, for patches
+        col_width = 2 if full else 1
+        self.moves = np.array([[list(b"\033[%03d;%03dH" % (FRAME_TOP + y, 1 + x * col_width))
+                                for x in range(WIDTH)] for y in range(self.rows)], dtype=np.uint8)
+        self.prev = None
+
+    def _cell_colors(self, pixels):
+        """Colour channels per cell: bg rgb (full), or fg rgb + bg rgb (half)."""
+        if self.full:
+            return pixels
+        # Cell (row, x) takes its fg from pixel row 2*row and bg from 2*row + 1
+        pairs = pixels.reshape(self.rows, 2, WIDTH, 3)
+        return np.concatenate((pairs[:, 0], pairs[:, 1]), axis=2)
+
+    def render(self, pixels):
+        """Return the ANSI byte chunks that bring the terminal up to date with pixels."""
+        colors = self._cell_colors(pixels)
+        for i, slot in enumerate(self.slots):
+            self.cells[:, :, slot:slot + 3] = DIGITS[colors[:, :, i]]
+        prev, self.prev = self.prev, colors
+
+        if prev is not None:
+            changed = (colors != prev).any(axis=2)
+            if np.count_nonzero(changed) <= changed.size * self.PATCH_LIMIT:
+                # Cursor move + the complete cell (every colour) per changed cell
+                patches = np.concatenate((self.moves[changed], self.cells[changed]), axis=1)
+                return [patches.tobytes(), RESET]
+
+        # Whole frame: only emit an fg/bg sequence when that colour changes along the row
+        for i in range(len(self.slots) // 3):
+            self.cell_keep[:, :, i * SGR_LEN:(i + 1) * SGR_LEN] = changed_color(colors[:, :, 3 * i:3 * i + 3])[..., None]
+        return [FRAME_HOME, self.screen[self.keep].tobytes()]
+
+
+def write_chunks(fd, chunks):
+    """Write byte chunks to fd straight from their buffers, normally in one writev."""
+    if hasattr(os, "writev"):
+        sent = os.writev(fd, chunks)
+        if sent == sum(map(len, chunks)):
+            return
+        data = memoryview(b"".join(chunks))[sent:]
+    else:
+        data = memoryview(b"".join(chunks))
+    while data:
+        data = data[os.write(fd, data):]
 
 
 def main():
     parser = argparse.ArgumentParser(description="Terminal mock Cosmic Unicorn")
     parser.add_argument("--port", "-p", type=int, default=8080, help="HTTP port (default: 8080)")
     parser.add_argument("--full", "-f", action="store_true", help="Use full blocks (wider but clearer)")
+    parser.add_argument("--rcvbuf", type=int, default=4 * 1024 * 1024,
+                        help="UDP receive buffer in bytes (default: 4 MiB, capped by net.core.rmem_max)")
+    parser.add_argument("--quiet", "-q", action="store_true", help="Don't log HTTP requests")
+    parser.add_argument("--udp-workers", type=int, default=1,
+                        help="UDP receiver threads sharing the port via SO_REUSEPORT (default: 1)")
     args = parser.parse_args()
 
+    if args.quiet:
+        # Skip the per-request write + flush entirely
+        CosmicHandler.log_message = lambda self, format, *args: None
+
     print(f"\033[2J\033[H", end="")  # Clear screen
     print(f"Cosmic Mock (terminal) - port {args.port}")
     print(f"UDP or POST /api/frame")
     print(f"Ctrl+C to quit\n")
 
     # Start UDP server (primary, low-latency)
-    udp_thread = threading.Thread(target=run_udp_server, args=(args.port,), daemon=True)
-    udp_thread.start()
+    reuseport = args.udp_workers > 1
+    for _ in range(max(1, args.udp_workers)):
+        udp_thread = threading.Thread(target=run_udp_server, args=(args.port, args.rcvbuf, reuseport), daemon=True)
+        udp_thread.start()
 
     # Start HTTP server (fallback)
     server_thread = threading.Thread(target=run_server, args=(args.port,), daemon=True)
     server_thread.start()
 
-    render = render_frame_full if args.full else render_frame_half
+    renderer = FrameRenderer(args.full)
     last_count = 0
 
-    # Hide cursor
-    print("\033[?25l", end="")
+    # Hide cursor. Frames bypass sys.stdout, so flush what's buffered first.
+    print("\033[?25l", end="", flush=True)
+    out_fd = sys.stdout.fileno()
+
+    next_render = time.monotonic()
 
     try:
         while True:
             if frame_updated.wait(timeout=0.1):
+                # Steady cadence: frames arriving before the next tick coalesce
+                # into one render of the latest frame, however fast the source
+                delay = next_render - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                next_render = max(next_render, time.monotonic()) + RENDER_INTERVAL
                 frame_updated.clear()
                 if frame_count[0] != last_count:
                     last_count = frame_count[0]
-                    lines = render()
-                    # Move cursor to line 5, render frame
-                    output = f"\033[5;1H"
-                    output += "\n".join(lines)
-                    output += f"\n\033[0m frame {last_count}"
-                    sys.stdout.write(output)
-                    sys.stdout.flush()
+                    with frame_lock:
+                        pixels = frame_view.copy()
+                    footer = b"\033[%d;1H\033[0m frame %d" % (FRAME_TOP + renderer.rows, last_count)
+                    write_chunks(out_fd, renderer.render(pixels) + [footer])
     except KeyboardInterrupt:
         pass
     finally:
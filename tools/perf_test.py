@@ -13,6 +13,8 @@ Usage:
 """
 
 import argparse
+import contextlib
+import gc
 import http.client
 import os
 import socket
@@ -20,15 +22,41 @@ import statistics
 import struct
 import time
 
+import numpy as np
+
 
 FRAME_SIZE = 32 * 32 * 3  # 3072 bytes
+RAMP_FRAME = bytes(range(256)) * (FRAME_SIZE // 256)  # byte i = i % 256, built once
+PIXEL_INDEX = np.arange(FRAME_SIZE // 3, dtype=np.uint16)
+CHANNEL_MUL = np.array([1, 2, 3], dtype=np.uint16)  # R, G, B multipliers of the pattern
+DELTA_ENTRY = np.dtype([("index", "<u2"), ("rgb", "u1", 3)])  # Wire layout of '<HBBB'
+DELTA_COUNT = struct.Struct('<H')
+RESP_BUF = bytearray(4096)  # Reused for every response body (see read_body)
 
 
 def create_connection(host, request_timeout=0.1):
     """Create optimized HTTP connection with aggressive timeouts."""
     conn = http.client.HTTPConnection(host, timeout=2.0)  # 2s for initial connect
     conn.connect()
-    sock = conn.sock
+    tune_socket(conn.sock, request_timeout)
+    return conn
+
+
+def reconnect(conn):
+    """Reset a connection after a failed request, keeping the same HTTPConnection.
+
+    A timed-out request leaves the stream mid-response, so the socket has to
+    go; the new handshake happens here, outside the next sample's timing.
+    """
+    request_timeout = conn.sock.gettimeout() if conn.sock else 0.1
+    conn.close()
+    conn.connect()
+    tune_socket(conn.sock, request_timeout)
+    return conn
+
+
+def tune_socket(sock, request_timeout):
+    """Apply request timeout and low-latency options to a connected socket."""
     sock.settimeout(request_timeout)  # 100ms for requests
     sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
     sock.setsockopt(socket.IPPROTO_IP, socket.IP_TOS, 0x10)     # IPTOS_LOWDELAY
@@ -39,31 +67,73 @@ def create_connection(host, request_timeout=0.1):
     sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 1)
     sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 1)
     sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 2)
-    return conn
+
+
+def read_body(resp):
+    """Drain a response into RESP_BUF without allocating.
+
+    Returns how many bytes of RESP_BUF are valid. Bodies longer than the
+    buffer are drained too, but only the last chunk read is kept, so the
+    count is that chunk's length rather than the full body length.
+    """
+    n = resp.readinto(RESP_BUF)
+    while not resp.isclosed():
+        chunk = resp.readinto(RESP_BUF)
+        if not chunk:
+            break
+        n = chunk
+    return n
+
+
+@contextlib.contextmanager
+def gc_paused():
+    """Keep the cyclic collector out of a measurement loop.
+
+    Collects up front so the loop starts with empty generations, then
+    disables the collector until the loop exits.
+    """
+    gc.collect()
+    gc.disable()
+    try:
+        yield
+    finally:
+        gc.enable()
+
+
+class Pacer:
+    """Fixed-rate loop pacing against an absolute perf_counter deadline.
+
+    Sleeping a fixed amount after each request adds the request's own time to
+    the period; advancing a deadline keeps the send rate at 1/interval.
+    """
+
+    def __init__(self, interval):
+        self.interval = interval
+        self.deadline = time.perf_counter()
+
+    def wait(self):
+        self.deadline += self.interval
+        delay = self.deadline - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        else:
+            self.deadline = time.perf_counter()  # Fell behind - don't burst to catch up
 
 
 def generate_frame(pattern: int) -> bytes:
     """Generate a test frame with a specific pattern."""
-    data = bytearray(FRAME_SIZE)
-    for i in range(0, FRAME_SIZE, 3):
-        pixel = (i // 3 + pattern) % 256
-        data[i] = pixel  # R
-        data[i + 1] = (pixel * 2) % 256  # G
-        data[i + 2] = (pixel * 3) % 256  # B
-    return bytes(data)
+    pixel = (PIXEL_INDEX + (pattern & 0xFF)) & 0xFF
+    # uint16 products wrap to % 256 on the cast back to bytes
+    return (pixel[:, None] * CHANNEL_MUL).astype(np.uint8).tobytes()
 
 
 def generate_delta(num_pixels: int, pattern: int) -> bytes:
     """Generate a delta frame with specified number of changed pixels."""
-    buf = bytearray(2 + num_pixels * 5)
-    struct.pack_into('<H', buf, 0, num_pixels)
-    for i in range(num_pixels):
-        idx = (i * 7) % 1024  # Spread pixels across display
-        r = (pattern + i) % 256
-        g = (pattern + i * 2) % 256
-        b = (pattern + i * 3) % 256
-        struct.pack_into('<HBBB', buf, 2 + i * 5, idx, r, g, b)
-    return bytes(buf)
+    i = np.arange(num_pixels)
+    entries = np.empty(num_pixels, dtype=DELTA_ENTRY)
+    entries["index"] = (i * 7) % 1024  # Spread pixels across display
+    entries["rgb"] = (pattern + i[:, None] * CHANNEL_MUL) % 256
+    return DELTA_COUNT.pack(num_pixels) + entries.tobytes()
 
 
 def test_latency(conn, num_samples=100):
@@ -73,26 +143,27 @@ def test_latency(conn, num_samples=100):
     latencies = []
     timeouts = 0
     headers = {"Content-Type": "application/octet-stream"}
-    host = conn.host
 
-    for i in range(num_samples):
-        frame = generate_frame(i)
+    with gc_paused():
+        pacer = Pacer(0.02)
+        for i in range(num_samples):
+            frame = generate_frame(i)
 
-        start = time.perf_counter()
-        try:
-            conn.request("POST", "/api/frame", body=frame, headers=headers)
-            resp = conn.getresponse()
-            resp.read()
-            elapsed = (time.perf_counter() - start) * 1000
+            start = time.perf_counter()
+            try:
+                conn.request("POST", "/api/frame", body=frame, headers=headers)
+                resp = conn.getresponse()
+                read_body(resp)
+                elapsed = (time.perf_counter() - start) * 1000
 
-            if resp.status == 200:
-                latencies.append(elapsed)
-        except Exception:
-            timeouts += 1
-            conn = create_connection(host)
+                if resp.status == 200:
+                    latencies.append(elapsed)
+            except Exception:
+                timeouts += 1
+                reconnect(conn)
 
-        # Small delay to let device draw
-        time.sleep(0.02)
+            # Small delay to let device draw
+            pacer.wait()
 
     if latencies:
         print(f"  Samples:  {len(latencies)}")
@@ -124,17 +195,13 @@ def test_throughput(conn, target_fps_list=[30, 50, 60, 100, 0]):
         start_time = time.perf_counter()
         duration = 3.0  # Test duration in seconds
 
-        last_send = 0
+        pacer = Pacer(frame_interval)
         pattern = 0
 
         while time.perf_counter() - start_time < duration:
             # Rate limiting
             if frame_interval > 0:
-                now = time.perf_counter()
-                elapsed = now - last_send
-                if elapsed < frame_interval:
-                    time.sleep(frame_interval - elapsed)
-                last_send = time.perf_counter()
+                pacer.wait()
 
             frame = generate_frame(pattern)
             pattern = (pattern + 1) % 256
@@ -142,10 +209,10 @@ def test_throughput(conn, target_fps_list=[30, 50, 60, 100, 0]):
             try:
                 conn.request("POST", "/api/frame", body=frame, headers=headers)
                 resp = conn.getresponse()
-                body = resp.read()
+                body_len = read_body(resp)
 
                 if resp.status == 200:
-                    if b'"busy"' in body:
+                    if RESP_BUF.find(b'"busy"', 0, body_len) >= 0:
                         busy += 1
                     else:
                         sent += 1
@@ -153,7 +220,7 @@ def test_throughput(conn, target_fps_list=[30, 50, 60, 100, 0]):
                     errors += 1
             except Exception as e:
                 errors += 1
-                conn = create_connection(conn.host)
+                reconnect(conn)
 
         actual_time = time.perf_counter() - start_time
         actual_fps = sent / actual_time if actual_time > 0 else 0
@@ -183,26 +250,27 @@ def test_busy_behavior(conn, burst_size=20):
     results = {'ok': 0, 'busy': 0, 'error': 0}
     latencies = []
 
-    for i in range(burst_size):
-        frame = generate_frame(i)
+    with gc_paused():
+        for i in range(burst_size):
+            frame = generate_frame(i)
 
-        start = time.perf_counter()
-        try:
-            conn.request("POST", "/api/frame", body=frame, headers=headers)
-            resp = conn.getresponse()
-            body = resp.read()
-            elapsed = (time.perf_counter() - start) * 1000
+            start = time.perf_counter()
+            try:
+                conn.request("POST", "/api/frame", body=frame, headers=headers)
+                resp = conn.getresponse()
+                body_len = read_body(resp)
+                elapsed = (time.perf_counter() - start) * 1000
 
-            if resp.status == 200:
-                if b'"busy"' in body:
-                    results['busy'] += 1
+                if resp.status == 200:
+                    if RESP_BUF.find(b'"busy"', 0, body_len) >= 0:
+                        results['busy'] += 1
+                    else:
+                        results['ok'] += 1
+                        latencies.append(elapsed)
                 else:
-                    results['ok'] += 1
-                    latencies.append(elapsed)
-            else:
+                    results['error'] += 1
+            except Exception:
                 results['error'] += 1
-        except Exception:
-            results['error'] += 1
 
     print(f"  OK:     {results['ok']:3d}")
     print(f"  Busy:   {results['busy']:3d}")
@@ -221,15 +289,16 @@ def test_delta_performance(conn, pixel_counts=[10, 50, 100, 300, 600]):
 
     # First test full frame
     full_latencies = []
+    pacer = Pacer(0.02)
     for i in range(50):
         frame = generate_frame(i)
         start = time.perf_counter()
         conn.request("POST", "/api/frame", body=frame, headers=headers)
         resp = conn.getresponse()
-        resp.read()
+        read_body(resp)
         if resp.status == 200:
             full_latencies.append((time.perf_counter() - start) * 1000)
-        time.sleep(0.02)
+        pacer.wait()
 
     full_avg = statistics.mean(full_latencies) if full_latencies else 0
     print(f"  Full frame (3072 bytes): {full_avg:.2f} ms avg")
@@ -237,15 +306,16 @@ def test_delta_performance(conn, pixel_counts=[10, 50, 100, 300, 600]):
     # Test delta with various pixel counts
     for count in pixel_counts:
         delta_latencies = []
+        pacer = Pacer(0.02)
         for i in range(50):
             delta = generate_delta(count, i)
             start = time.perf_counter()
             conn.request("POST", "/api/delta", body=delta, headers=headers)
             resp = conn.getresponse()
-            resp.read()
+            read_body(resp)
             if resp.status == 200:
                 delta_latencies.append((time.perf_counter() - start) * 1000)
-            time.sleep(0.02)
+            pacer.wait()
 
         if delta_latencies:
             avg = statistics.mean(delta_latencies)
@@ -267,15 +337,11 @@ def test_sustained(conn, duration=10, target_fps=30):
     latencies = []
 
     start_time = time.perf_counter()
-    last_send = 0
+    pacer = Pacer(frame_interval)
     pattern = 0
 
     while time.perf_counter() - start_time < duration:
-        now = time.perf_counter()
-        elapsed = now - last_send
-        if elapsed < frame_interval:
-            time.sleep(frame_interval - elapsed)
-        last_send = time.perf_counter()
+        pacer.wait()
 
         frame = generate_frame(pattern)
         pattern = (pattern + 1) % 256
@@ -284,11 +350,11 @@ def test_sustained(conn, duration=10, target_fps=30):
         try:
             conn.request("POST", "/api/frame", body=frame, headers=headers)
             resp = conn.getresponse()
-            body = resp.read()
+            body_len = read_body(resp)
             req_time = (time.perf_counter() - req_start) * 1000
 
             if resp.status == 200:
-                if b'"busy"' in body:
+                if RESP_BUF.find(b'"busy"', 0, body_len) >= 0:
                     busy += 1
                 else:
                     sent += 1
@@ -297,7 +363,7 @@ def test_sustained(conn, duration=10, target_fps=30):
                 errors += 1
         except Exception:
             errors += 1
-            conn = create_connection(conn.host)
+            reconnect(conn)
 
     actual_time = time.perf_counter() - start_time
     actual_fps = sent / actual_time
@@ -337,45 +403,49 @@ def test_wifi_vs_gc(conn, duration=30):
     print("\n  Phase 1: Minimal requests (GET /api/status)...")
     minimal_latencies = []
     minimal_spikes = []
-    start = time.perf_counter()
 
-    while time.perf_counter() - start < duration / 2:
-        req_start = time.perf_counter()
-        try:
-            conn.request("GET", "/api/status")
-            resp = conn.getresponse()
-            resp.read()
-            latency = (time.perf_counter() - req_start) * 1000
-            minimal_latencies.append(latency)
-            if latency > 50:  # Spike threshold
-                minimal_spikes.append((time.perf_counter() - start, latency))
-        except Exception:
-            pass
-        time.sleep(0.01)  # 100 req/s max
+    with gc_paused():
+        start = time.perf_counter()
+        pacer = Pacer(0.01)
+        while time.perf_counter() - start < duration / 2:
+            req_start = time.perf_counter()
+            try:
+                conn.request("GET", "/api/status")
+                resp = conn.getresponse()
+                read_body(resp)
+                latency = (time.perf_counter() - req_start) * 1000
+                minimal_latencies.append(latency)
+                if latency > 50:  # Spike threshold
+                    minimal_spikes.append((time.perf_counter() - start, latency))
+            except Exception:
+                pass
+            pacer.wait()  # 100 req/s max
 
     # Test 2: Full frames with pre-allocated buffer - isolates WiFi + device processing
     print("  Phase 2: Full frames (pre-allocated buffer)...")
     headers = {"Content-Type": "application/octet-stream"}
-    # Pre-allocate a single frame buffer to minimize Python allocations
-    static_frame = bytes([i % 256 for i in range(FRAME_SIZE)])
+    # Reuse the module-level frame to minimize Python allocations
+    static_frame = RAMP_FRAME
 
     frame_latencies = []
     frame_spikes = []
-    phase2_start = time.perf_counter()
 
-    while time.perf_counter() - phase2_start < duration / 2:
-        req_start = time.perf_counter()
-        try:
-            conn.request("POST", "/api/frame", body=static_frame, headers=headers)
-            resp = conn.getresponse()
-            resp.read()
-            latency = (time.perf_counter() - req_start) * 1000
-            frame_latencies.append(latency)
-            if latency > 50:
-                frame_spikes.append((time.perf_counter() - phase2_start, latency))
-        except Exception:
-            pass
-        time.sleep(0.02)  # 50 req/s max
+    with gc_paused():
+        phase2_start = time.perf_counter()
+        pacer = Pacer(0.02)
+        while time.perf_counter() - phase2_start < duration / 2:
+            req_start = time.perf_counter()
+            try:
+                conn.request("POST", "/api/frame", body=static_frame, headers=headers)
+                resp = conn.getresponse()
+                read_body(resp)
+                latency = (time.perf_counter() - req_start) * 1000
+                frame_latencies.append(latency)
+                if latency > 50:
+                    frame_spikes.append((time.perf_counter() - phase2_start, latency))
+            except Exception:
+                pass
+            pacer.wait()  # 50 req/s max
 
     # Analysis
     print("\n  Results:")
@@ -418,38 +488,48 @@ def test_wifi_vs_gc(conn, duration=30):
     }
 
 
-def test_gc_isolation(conn, duration=20):
+def test_gc_isolation(conn, duration=20, paused_duration=None):
     """
     Test to isolate Python GC by comparing:
     1. Tight loop with allocations (triggers GC)
     2. Tight loop without allocations (no GC)
+    3. Same allocations with the collector paused (see gc_paused)
+
+    Phases 1 and 2 split duration as before; phase 3 runs for
+    paused_duration on top (default: as long as phase 1).
     """
-    print(f"\n=== GC Isolation Test ({duration}s) ===")
+    if paused_duration is None:
+        paused_duration = duration / 2
+    print(f"\n=== GC Isolation Test ({duration}s + {paused_duration}s GC paused) ===")
 
     headers = {"Content-Type": "application/octet-stream"}
 
-    # Phase 1: With allocations (new frame each time)
-    print("\n  Phase 1: With allocations (new bytes() each request)...")
-    alloc_latencies = []
-    alloc_spikes = []
-    start = time.perf_counter()
+    def alloc_phase(phase_time):
+        latencies = []
+        spikes = []
+        start = time.perf_counter()
+        pacer = Pacer(0.02)
+        while time.perf_counter() - start < phase_time:
+            # Allocate new frame each time - triggers GC eventually
+            frame = bytes([((i + int(time.perf_counter() * 1000)) % 256) for i in range(FRAME_SIZE)])
 
-    while time.perf_counter() - start < duration / 2:
-        # Allocate new frame each time - triggers GC eventually
-        frame = bytes([((i + int(time.perf_counter() * 1000)) % 256) for i in range(FRAME_SIZE)])
+            req_start = time.perf_counter()
+            try:
+                conn.request("POST", "/api/frame", body=frame, headers=headers)
+                resp = conn.getresponse()
+                read_body(resp)
+                latency = (time.perf_counter() - req_start) * 1000
+                latencies.append(latency)
+                if latency > 50:
+                    spikes.append(latency)
+            except Exception:
+                pass
+            pacer.wait()
+        return latencies, spikes
 
-        req_start = time.perf_counter()
-        try:
-            conn.request("POST", "/api/frame", body=frame, headers=headers)
-            resp = conn.getresponse()
-            resp.read()
-            latency = (time.perf_counter() - req_start) * 1000
-            alloc_latencies.append(latency)
-            if latency > 50:
-                alloc_spikes.append(latency)
-        except Exception:
-            pass
-        time.sleep(0.02)
+    # Phase 1: With allocations (new frame each time)
+    print("\n  Phase 1: With allocations (new bytes() each request)...")
+    alloc_latencies, alloc_spikes = alloc_phase(duration / 2)
 
     # Phase 2: Without allocations (reuse buffer)
     print("  Phase 2: Without allocations (reuse buffer)...")
@@ -458,6 +538,7 @@ def test_gc_isolation(conn, duration=20):
     noalloc_spikes = []
     start = time.perf_counter()
 
+    pacer = Pacer(0.02)
     while time.perf_counter() - start < duration / 2:
         # Modify in place - no allocations
         for i in range(0, min(100, FRAME_SIZE)):  # Just touch a few bytes
@@ -467,14 +548,19 @@ def test_gc_isolation(conn, duration=20):
         try:
             conn.request("POST", "/api/frame", body=static_frame, headers=headers)
             resp = conn.getresponse()
-            resp.read()
+            read_body(resp)
             latency = (time.perf_counter() - req_start) * 1000
             noalloc_latencies.append(latency)
             if latency > 50:
                 noalloc_spikes.append(latency)
         except Exception:
             pass
-        time.sleep(0.02)
+        pacer.wait()
+
+    # Phase 3: Allocations again, collector paused
+    print("  Phase 3: With allocations, GC paused...")
+    with gc_paused():
+        paused_latencies, paused_spikes = alloc_phase(paused_duration)
 
     # Results
     print("\n  Results:")
@@ -486,9 +572,15 @@ def test_gc_isolation(conn, duration=20):
     if noalloc_latencies:
         print(f"      Mean: {statistics.mean(noalloc_latencies):.2f} ms, Max: {max(noalloc_latencies):.2f} ms")
 
+    print(f"    Allocations, GC paused: {len(paused_latencies)} samples, {len(paused_spikes)} spikes")
+    if paused_latencies:
+        print(f"      Mean: {statistics.mean(paused_latencies):.2f} ms, Max: {max(paused_latencies):.2f} ms")
+
     print("\n  Diagnosis:")
     if len(alloc_spikes) > len(noalloc_spikes) * 2:
         print("    -> More spikes with allocations suggests PYTHON GC")
+        if len(alloc_spikes) > len(paused_spikes) * 2:
+            print("       (confirmed: pausing the collector removes them)")
     elif len(alloc_spikes) > 0 or len(noalloc_spikes) > 0:
         print("    -> Similar spike counts suggests WIFI (not GC)")
     else:
@@ -502,7 +594,7 @@ def test_timeout_sweep(host, samples_per_timeout=200):
     print("-" * 60)
 
     headers = {"Content-Type": "application/octet-stream"}
-    frame = bytes([i % 256 for i in range(FRAME_SIZE)])
+    frame = RAMP_FRAME
 
     def make_conn(timeout_s):
         # Use longer timeout for connection, shorter for requests
@@ -525,12 +617,13 @@ def test_timeout_sweep(host, samples_per_timeout=200):
         latencies = []
         timeouts = 0
 
+        pacer = Pacer(0.02)
         for i in range(samples_per_timeout):
             start = time.perf_counter()
             try:
                 conn.request("POST", "/api/frame", body=frame, headers=headers)
                 resp = conn.getresponse()
-                resp.read()
+                read_body(resp)
                 elapsed = (time.perf_counter() - start) * 1000
                 latencies.append(elapsed)
             except Exception:
@@ -544,7 +637,7 @@ def test_timeout_sweep(host, samples_per_timeout=200):
                 except:
                     pass  # Will fail on next iteration
 
-            time.sleep(0.02)
+            pacer.wait()
 
         try:
             conn.close()
@@ -580,6 +673,10 @@ def main():
     status = resp.read().decode()
     print(f"Device status: {status}")
 
+    # Everything built so far (frame LUTs, connection) lives for the whole
+    # run; move it out of the collector's generations
+    gc.freeze()
+
     tests = {
         'latency': lambda: test_latency(create_connection(args.host)),
         'throughput': lambda: test_throughput(create_connection(args.host)),
@@ -6,18 +6,24 @@ with depth for each quad slice to create the Rez look.
 
 import bpy
 import math
-from mathutils import Vector
+import numpy as np
 
 # ---- Clean scene ----
 bpy.ops.object.select_all(action='SELECT')
 bpy.ops.object.delete(use_global=False)
-for m in list(bpy.data.meshes):
-    bpy.data.meshes.remove(m)
-for m in list(bpy.data.materials):
-    bpy.data.materials.remove(m)
+# One batch_remove instead of a remove() (and relations update) per datablock
+bpy.data.batch_remove([*bpy.data.meshes, *bpy.data.materials])
 
 # ---- Material ----
-def make_emit(name, color, strength=5.0):
+# Per-region emission (color, strength). One material covers the whole
+# model; each face carries its region's values as mesh attributes.
+EMIT = {
+    "body": ((0.12, 0.55, 0.85), 3.0),
+    "head": ((0.25, 0.7, 0.95), 5.0),
+    "visor": ((0.85, 0.92, 1.0), 10.0),
+}
+
+def make_emit(name, color_attr, strength_attr):
     mat = bpy.data.materials.new(name=name)
     mat.use_nodes = True
     nodes = mat.node_tree.nodes
@@ -26,15 +32,17 @@ def make_emit(name, color, strength=5.0):
         nodes.remove(n)
     out = nodes.new('ShaderNodeOutputMaterial')
     em = nodes.new('ShaderNodeEmission')
-    em.inputs['Color'].default_value = (*color, 1.0)
-    em.inputs['Strength'].default_value = strength
+    color = nodes.new('ShaderNodeAttribute')
+    color.attribute_name = color_attr
+    strength = nodes.new('ShaderNodeAttribute')
+    strength.attribute_name = strength_attr
+    links.new(color.outputs['Color'], em.inputs['Color'])
+    links.new(strength.outputs['Fac'], em.inputs['Strength'])
     links.new(em.outputs['Emission'], out.inputs['Surface'])
-    mat.diffuse_color = (*color, 1.0)
+    mat.diffuse_color = (*EMIT["body"][0], 1.0)
     return mat
 
-mat_body = make_emit("Rez_Body", (0.12, 0.55, 0.85), 3.0)
-mat_head = make_emit("Rez_Head", (0.25, 0.7, 0.95), 5.0)
-mat_visor = make_emit("Rez_Visor", (0.85, 0.92, 1.0), 10.0)
+mat_emit = make_emit("Rez_Emit", "Col", "EmitStrength")
 
 parent = bpy.data.objects.new("RezHumanoid", None)
 bpy.context.collection.objects.link(parent)
@@ -107,73 +115,107 @@ quad_parts = [
 
 SCALE = 0.1  # scale factor: 32 pixels -> 3.2 blender units
 
-def grid_to_3d(gx, gy, depth=0):
-    """Convert grid coords to Blender 3D coords."""
-    x = (gx - 16) * SCALE
-    z = (16 - gy) * SCALE   # flip Y to Z-up
-    y = depth * SCALE
-    return (x, y, z)
-
-def make_frame_quad(v0, v1, v2, v3, depth, bar_thickness, material):
-    """Create a hollow rectangular frame (4 bars) from 4 corner positions,
-    extruded along Y by depth."""
-    corners_front = [Vector(v0), Vector(v1), Vector(v2), Vector(v3)]
-    corners_back = [Vector((v[0], v[1] + depth, v[2])) for v in [v0, v1, v2, v3]]
-
-    # For each edge of the quad, create a thin box (bar)
-    edge_pairs = [(0,1), (1,2), (2,3), (3,0)]
-
-    for a, b in edge_pairs:
-        # Front edge
-        fa, fb = corners_front[a], corners_front[b]
-        ba, bb = corners_back[a], corners_back[b]
-
-        # Direction along edge
-        edge_dir = (fb - fa).normalized()
-        # Normal (perpendicular in XZ plane)
-        normal = Vector((0, 0, 0))
-        if abs(edge_dir.x) > abs(edge_dir.z):
-            normal = Vector((0, 0, bar_thickness/2))
-        else:
-            normal = Vector((bar_thickness/2, 0, 0))
-
-        verts = [
-            (fa + normal)[:], (fb + normal)[:],
-            (fb - normal)[:], (fa - normal)[:],
-            (ba + normal)[:], (bb + normal)[:],
-            (bb - normal)[:], (ba - normal)[:],
-        ]
-
-        mesh = bpy.data.meshes.new("bar")
-        mesh.from_pydata(
-            verts, [],
-            [(0,1,2,3),(7,6,5,4),(0,4,5,1),(2,6,7,3),(0,3,7,4),(1,5,6,2)]
-        )
-        mesh.update()
-        obj = bpy.data.objects.new("bar", mesh)
-        bpy.context.collection.objects.link(obj)
-        obj.data.materials.append(material)
-        obj.parent = parent
+def grid_to_3d(grid, depth=0):
+    """Convert (N, 2) grid coords to (N, 3) Blender 3D coords."""
+    grid = np.asarray(grid, dtype=np.float64)
+    pos = np.empty((len(grid), 3), dtype=np.float32)
+    pos[:, 0] = (grid[:, 0] - 16) * SCALE
+    pos[:, 1] = depth * SCALE
+    pos[:, 2] = (16 - grid[:, 1]) * SCALE   # flip Y to Z-up
+    return pos
+
+# Each quad edge becomes one bar; a bar is a box over 8 vertices
+# (front ring 0-3, back ring 4-7)
+EDGE_PAIRS = np.array([(0,1), (1,2), (2,3), (3,0)])
+BAR_FACES = np.array(
+    [(0,1,2,3),(7,6,5,4),(0,4,5,1),(2,6,7,3),(0,3,7,4),(1,5,6,2)], dtype=np.int32
+)
+
+def quad_mesh(name, verts, corner_verts):
+    """Build a quad-only mesh straight from numpy arrays.
+
+    foreach_set copies each array in one go instead of converting
+    element by element the way from_pydata does.
+    """
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(len(verts))
+    mesh.loops.add(len(corner_verts))
+    mesh.polygons.add(len(corner_verts) // 4)
+    mesh.attributes["position"].data.foreach_set("vector", verts.ravel())
+    mesh.loops.foreach_set("vertex_index", corner_verts)
+    # loop_total follows from consecutive loop_start values
+    mesh.polygons.foreach_set("loop_start", np.arange(0, len(corner_verts), 4, dtype=np.int32))
+    mesh.update(calc_edges=True)
+    return mesh
+
+def make_frame_quad(front, depth, bar_thickness):
+    """Geometry of a hollow rectangular frame (4 bars) from its (4, 3) corner
+    positions, extruded along Y by depth.
+
+    Returns (32, 3) vertices and (24, 4) quad faces indexing into them.
+    """
+    back = front + np.float32((0, depth, 0))
+
+    # Both ends of every edge at once: (4 bars, 3)
+    fa, fb = front[EDGE_PAIRS[:, 0]], front[EDGE_PAIRS[:, 1]]
+    ba, bb = back[EDGE_PAIRS[:, 0]], back[EDGE_PAIRS[:, 1]]
+
+    # Normal (perpendicular in XZ plane): offset in Z for mostly-horizontal
+    # edges, in X otherwise
+    edge_dir = fb - fa
+    horizontal = np.abs(edge_dir[:, 0]) > np.abs(edge_dir[:, 2])
+    normal = np.zeros((4, 3), dtype=np.float32)
+    normal[horizontal, 2] = bar_thickness / 2
+    normal[~horizontal, 0] = bar_thickness / 2
+
+    verts = np.stack([
+        fa + normal, fb + normal,
+        fb - normal, fa - normal,
+        ba + normal, bb + normal,
+        bb - normal, ba - normal,
+    ], axis=1)  # (4 bars, 8, 3)
+    corner_verts = BAR_FACES + 8 * np.arange(4, dtype=np.int32)[:, None, None]
+
+    return verts.reshape(-1, 3), corner_verts.reshape(-1, 4)
 
 # ---- Build the model ----
 DEPTH = 3.0       # depth in grid units (how deep each quad extends in Y)
 BAR = 0.03        # bar thickness in blender units
 
-for qi, quad in enumerate(quads):
-    i0, i1, i2, i3 = quad
-    part = quad_parts[qi]
+# All frames go into one mesh (one object, one draw batch); faces pick
+# their emission through per-face attributes read by mat_emit
+regions = list(EMIT)
+all_verts = []
+all_faces = []
+face_region = []
+vert_count = 0
 
-    mat = mat_body
-    if part == "head":
-        mat = mat_head
-
-    # Convert 4 corners to 3D
-    v0 = grid_to_3d(verts_2d[i0][0], verts_2d[i0][1])
-    v1 = grid_to_3d(verts_2d[i1][0], verts_2d[i1][1])
-    v2 = grid_to_3d(verts_2d[i2][0], verts_2d[i2][1])
-    v3 = grid_to_3d(verts_2d[i3][0], verts_2d[i3][1])
+# 3D corners of every quad in one pass: (quads, 4, 3)
+corners = grid_to_3d(verts_2d)[np.array(quads)]
 
-    make_frame_quad(v0, v1, v2, v3, DEPTH * SCALE, BAR, mat)
+for qi, part in enumerate(quad_parts):
+    region = regions.index("body")
+    if part == "head":
+        region = regions.index("head")
+
+    verts, faces = make_frame_quad(corners[qi], DEPTH * SCALE, BAR)
+    all_verts.append(verts)
+    all_faces.append(faces + vert_count)
+    face_region.append(np.full(len(faces), region, dtype=np.int32))
+    vert_count += len(verts)
+
+mesh = quad_mesh("RezFrames", np.concatenate(all_verts), np.concatenate(all_faces).ravel())
+mesh.materials.append(mat_emit)
+face_region = np.concatenate(face_region)
+region_rgba = np.array([(*color, 1.0) for color, _ in EMIT.values()], dtype=np.float32)
+region_strength = np.array([strength for _, strength in EMIT.values()], dtype=np.float32)
+mesh.attributes.new("Col", 'FLOAT_COLOR', 'FACE').data.foreach_set(
+    "color", region_rgba[face_region].ravel())
+mesh.attributes.new("EmitStrength", 'FLOAT', 'FACE').data.foreach_set(
+    "value", region_strength[face_region])
+obj = bpy.data.objects.new("RezFrames", mesh)
+bpy.context.collection.objects.link(obj)
+obj.parent = parent
 
 # ---- Scale ----
 parent.scale = (3, 3, 3)
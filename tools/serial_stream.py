@@ -22,8 +22,12 @@ import struct
 import statistics
 import time
 
+import numpy as np
+
 
 FRAME_SIZE = 32 * 32 * 3  # 3072 bytes
+DELTA_HEADER = struct.Struct('<BH')  # Command byte + entry count
+DELTA_ENTRY = np.dtype([("index", "<u2"), ("rgb", "u1", 3)])  # Wire layout of '<HBBB'
 
 CMD_FRAME = 0xFE
 CMD_DELTA = 0xFD
@@ -52,7 +56,7 @@ def find_pico_port():
 class SerialSender:
     """Send frames over serial with optimized buffering."""
 
-    def __init__(self, port, baudrate=921600):
+    def __init__(self, port, baudrate=921600, max_outstanding=4):
         # USB CDC ignores baud rate, but set high for documentation
         self.ser = serial.Serial(port, baudrate, timeout=0.1)
         self.ser.write_timeout = 0.05
@@ -64,36 +68,92 @@ class SerialSender:
         # Pre-allocated buffer to avoid allocations
         self._frame_buf = bytearray(1 + FRAME_SIZE)
         self._frame_buf[0] = CMD_FRAME
+        self._frame_view = memoryview(self._frame_buf)[1:]
+        # Copy of the last acked frame (prev_frame points here once set), so
+        # callers can keep mutating the buffer they passed in
+        self._prev_buf = bytearray(FRAME_SIZE)
+        self._prev_view = memoryview(self._prev_buf)
+        self._brightness_buf = bytearray([CMD_BRIGHTNESS, 0])
+        self._resp = bytearray(1)
+        # Pipelined sends: frames written whose response hasn't been read yet
+        self.max_outstanding = max_outstanding
+        self._outstanding = 0
+
+    def _read_resp(self) -> int:
+        """Read the 1-byte response into a reused buffer; 0 on timeout."""
+        return self._resp[0] if self.ser.readinto(self._resp) else 0
+
+    def _drain_one(self) -> bool:
+        """Read the oldest pipelined frame's response and count it."""
+        self._outstanding -= 1
+        resp = self._read_resp()
+        if resp == RESP_OK:
+            self.stats_full += 1
+            return True
+        elif resp == RESP_BUSY:
+            self.stats_busy += 1
+            return True  # Not an error
+        else:
+            self.stats_error += 1
+            return False
 
-    def send_frame(self, rgb_data: bytes) -> bool:
-        """Send full frame using pre-allocated buffer."""
-        self._frame_buf[1:] = rgb_data
+    def flush(self) -> bool:
+        """Wait for every pipelined response; False if any was an error."""
+        ok = True
+        while self._outstanding:
+            ok = self._drain_one() and ok
+        return ok
+
+    def send_frame_pipelined(self, rgb_data) -> bool:
+        """Send full frame without waiting for its own response.
+
+        Up to max_outstanding responses are left in flight, so the next
+        frame is already on the wire while the device draws. The result
+        is that of the oldest response drained to make room (True if none).
+        """
+        self._frame_view[:] = memoryview(rgb_data).cast("B")
+        self.ser.write(self._frame_buf)
+        # Which frame the device ends up showing isn't known until the
+        # responses are read; make the next delta start from a full frame
+        self.prev_frame = None
+        self._outstanding += 1
+        if self._outstanding > self.max_outstanding:
+            return self._drain_one()
+        return True
+
+    def send_frame(self, rgb_data) -> bool:
+        """Send full frame using pre-allocated buffer.
+
+        rgb_data can be any contiguous buffer (bytes, bytearray, numpy array).
+        """
+        if self._outstanding:
+            self.flush()
+        # One 3 KB copy is cheaper than a second write() for the header;
+        # the fixed-size view raises on a wrong length instead of resizing
+        self._frame_view[:] = memoryview(rgb_data).cast("B")
         self.ser.write(self._frame_buf)
-        resp = self.ser.read(1)
-        if resp and resp[0] == RESP_OK:
-            self.prev_frame = rgb_data
+        resp = self._read_resp()
+        if resp == RESP_OK:
+            self._prev_view[:] = self._frame_view
+            self.prev_frame = self._prev_buf
             self.stats_full += 1
             return True
-        elif resp and resp[0] == RESP_BUSY:
+        elif resp == RESP_BUSY:
             self.stats_busy += 1
             return True  # Not an error
         else:
             self.stats_error += 1
             return False
 
-    def send_delta(self, rgb_data: bytes) -> bool:
+    def send_delta(self, rgb_data) -> bool:
         """Send delta frame if beneficial."""
         if self.prev_frame is None:
             return self.send_frame(rgb_data)
 
-        # Find changed pixels
-        changes = []
-        for i in range(0, FRAME_SIZE, 3):
-            if (rgb_data[i] != self.prev_frame[i] or
-                rgb_data[i+1] != self.prev_frame[i+1] or
-                rgb_data[i+2] != self.prev_frame[i+2]):
-                idx = i // 3
-                changes.append((idx, rgb_data[i], rgb_data[i+1], rgb_data[i+2]))
+        # Find changed pixels: compare whole frames as (pixel, rgb) arrays
+        cur = np.frombuffer(rgb_data, dtype=np.uint8).reshape(-1, 3)
+        prev = np.frombuffer(self.prev_frame, dtype=np.uint8).reshape(-1, 3)
+        changes = np.flatnonzero((cur != prev).any(axis=1))
 
         if len(changes) == 0:
             return True  # No changes
@@ -104,20 +164,23 @@ class SerialSender:
         if len(changes) > 600:
             return self.send_frame(rgb_data)
 
-        # Build delta packet
-        buf = bytearray(1 + 2 + len(changes) * 5)
-        buf[0] = CMD_DELTA
-        struct.pack_into('<H', buf, 1, len(changes))
-        for i, (idx, r, g, b) in enumerate(changes):
-            struct.pack_into('<HBBB', buf, 3 + i * 5, idx, r, g, b)
+        # Build delta packet, filling the entries in place as one record array
+        buf = bytearray(DELTA_HEADER.size + len(changes) * DELTA_ENTRY.itemsize)
+        DELTA_HEADER.pack_into(buf, 0, CMD_DELTA, len(changes))
+        entries = np.frombuffer(buf, dtype=DELTA_ENTRY, offset=DELTA_HEADER.size)
+        entries["index"] = changes
+        entries["rgb"] = cur[changes]
 
+        if self._outstanding:
+            self.flush()
         self.ser.write(buf)
-        resp = self.ser.read(1)
-        if resp == bytes([RESP_OK]):
-            self.prev_frame = rgb_data
+        resp = self._read_resp()
+        if resp == RESP_OK:
+            self._prev_view[:] = cur.reshape(-1)
+            self.prev_frame = self._prev_buf
             self.stats_delta += 1
             return True
-        elif resp == bytes([RESP_BUSY]):
+        elif resp == RESP_BUSY:
             self.stats_busy += 1
             return True
         else:
@@ -127,9 +190,11 @@ class SerialSender:
     def set_brightness(self, value: float) -> bool:
         """Set brightness (0.0 - 1.0)."""
         val = int(max(0, min(255, value * 255)))
-        self.ser.write(bytes([CMD_BRIGHTNESS, val]))
-        resp = self.ser.read(1)
-        return resp == bytes([RESP_OK])
+        if self._outstanding:
+            self.flush()
+        self._brightness_buf[1] = val
+        self.ser.write(self._brightness_buf)
+        return self._read_resp() == RESP_OK
 
     def close(self):
         self.ser.close()
@@ -140,11 +205,12 @@ def test_latency(sender, samples=100):
     print(f"\n=== Serial Latency Test ({samples} samples) ===")
 
     latencies = []
-    frame = bytes([(i + 128) % 256 for i in range(FRAME_SIZE)])
+    frame = ((np.arange(FRAME_SIZE) + 128) % 256).astype(np.uint8)
 
     for i in range(samples):
-        # Modify frame slightly
-        frame = bytes([(b + 1) % 256 for b in frame[:100]]) + frame[100:]
+        # Modify frame slightly (uint8 wraps at 256 on its own); send_frame
+        # takes the array as-is, so nothing is allocated per sample
+        frame[:100] += 1
 
         start = time.perf_counter()
         ok = sender.send_frame(frame)
@@ -173,22 +239,27 @@ def test_throughput(sender, duration=5):
     """Test maximum throughput."""
     print(f"\n=== Serial Throughput Test ({duration}s) ===")
 
-    frame = bytes([i % 256 for i in range(FRAME_SIZE)])
-    sent = 0
+    frame = (np.arange(FRAME_SIZE) % 256).astype(np.uint8)
+    # Only frames the device accepted count towards FPS; busy acks
+    # were rejected and are reported on their own
+    full_before = sender.stats_full
+    busy_before = sender.stats_busy
     start = time.perf_counter()
 
     while time.perf_counter() - start < duration:
-        frame = bytes([(b + 1) % 256 for b in frame])
-        if sender.send_frame(frame):
-            sent += 1
+        frame += 1
+        sender.send_frame_pipelined(frame)
 
+    sender.flush()
     elapsed = time.perf_counter() - start
+    sent = sender.stats_full - full_before
+    busy = sender.stats_busy - busy_before
     fps = sent / elapsed
 
     print(f"  Duration: {elapsed:.1f}s")
     print(f"  Sent:     {sent} frames")
     print(f"  FPS:      {fps:.1f}")
-    print(f"  Busy:     {sender.stats_busy}")
+    print(f"  Busy:     {busy}")
     print(f"  Errors:   {sender.stats_error}")
 
     return fps
@@ -203,20 +274,12 @@ def test_animation(sender, duration=5):
 
     while time.perf_counter() - start < duration:
         # Rainbow sweep
-        frame = bytearray(FRAME_SIZE)
         t = time.perf_counter() - start
-        for y in range(32):
-            for x in range(32):
-                hue = (x + y + int(t * 30)) % 256
-                r, g, b = hue_to_rgb(hue)
-                idx = (y * 32 + x) * 3
-                frame[idx] = r
-                frame[idx + 1] = g
-                frame[idx + 2] = b
-
-        sender.send_frame(bytes(frame))
+        hues = (DIAGONAL + int(t * 30)) % 256
+        sender.send_frame_pipelined(HUE_LUT[hues])
         frame_num += 1
 
+    sender.flush()
     elapsed = time.perf_counter() - start
     print(f"  Frames: {frame_num}")
     print(f"  FPS:    {frame_num / elapsed:.1f}")
@@ -240,11 +303,18 @@ def hue_to_rgb(hue):
         return 255, 0, 255 - remainder
 
 
+HUE_LUT = np.array([hue_to_rgb(h) for h in range(256)], dtype=np.uint8)  # (256, 3)
+DIAGONAL = np.add.outer(np.arange(32), np.arange(32))  # x + y for every pixel, row-major
+
+
 def main():
     parser = argparse.ArgumentParser(description="Serial streaming test")
     parser.add_argument("--port", help="Serial port (auto-detect if not specified)")
     parser.add_argument("--test", choices=["latency", "throughput", "animation", "all"],
                         default="all", help="Which test to run")
+    parser.add_argument("--pipeline", type=int, default=4,
+                        help="Frames in flight before waiting for a response in the "
+                             "throughput/animation tests (0 = wait on every frame)")
     args = parser.parse_args()
 
     port = args.port or find_pico_port()
@@ -253,7 +323,7 @@ def main():
         return 1
 
     print(f"Connecting to {port}...")
-    sender = SerialSender(port)
+    sender = SerialSender(port, max_outstanding=args.pipeline)
 
     # Set initial brightness
     sender.set_brightness(0.5)
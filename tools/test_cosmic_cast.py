@@ -0,0 +1,27 @@
+"""Tests for cosmic_cast's capture-to-sender frame handoff."""
+
+from cosmic_cast import FrameMailbox
+
+
+def test_pool_size_constant_when_sender_falls_behind():
+    """Frames displaced before the sender takes them go back to the pool."""
+    mailbox = FrameMailbox(16)
+    pool = {id(buf) for buf in mailbox.free}
+
+    # Mimic the send loop: capture publishes three frames while each one is
+    # on the wire, and the sender keeps the previous frame for deltas
+    held = sending = None
+    for i in range(100):
+        for _ in range(3):
+            buf = mailbox.get_buffer()
+            assert id(buf) in pool  # No fallback allocation
+            buf[0] = i % 256
+            mailbox.put(buf)
+        if held is not None:
+            mailbox.recycle(held)
+        held, sending = sending, mailbox.take()
+        assert sending is not None
+
+    assert mailbox.take() is None  # Sender took the newest frame
+    in_use = len(mailbox.free) + (held is not None) + (sending is not None)
+    assert in_use == FrameMailbox.POOL_SIZE